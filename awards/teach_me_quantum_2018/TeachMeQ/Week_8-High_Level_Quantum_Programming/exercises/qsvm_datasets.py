@@ -15,9 +15,11 @@
 # limitations under the License.
 # =============================================================================
 
+import hashlib
+import json
+import os
+
 import numpy as np
-import scipy
-from scipy.linalg import expm
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from sklearn import datasets
@@ -26,38 +28,97 @@ from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.decomposition import PCA
 
 
-def ad_hoc_data(training_size, test_size, n, gap, PLOT_DATA):
-    class_labels = [r'A', r'B']
-    if n == 2:
-        N = 100
-    elif n == 3:
-        N = 20   # courseness of data seperation
+def feature_map_states(x, reps=2):
+    """
+    States psi(x) = U(x) H^n ... U(x) H^n |0>^n of the ad-hoc (ZZ) feature map with reps
+    layers for every row of x, the map of the ad-hoc dataset has reps=2.
+    U(x) = exp(1j*phi(x)) is diagonal in the Z basis, so it is applied elementwise
+    instead of with expm.
+
+    x: (points, n) array of feature vectors.
+    reps: Number of layers, at least 1.
+
+    Returns a (points, 2**n) complex array, qubit 0 is the most significant bit.
+    """
+    if reps < 1:
+        raise ValueError('The feature map needs reps >= 1, got %s.' % reps)
+    x = np.asarray(x, dtype=float)
+    n = x.shape[1]
+    # Z eigenvalue of every qubit in every basis state
+    z = 1-2*((np.arange(2**n) >> np.arange(n-1, -1, -1)[:, None]) & 1)
+    i, j = np.triu_indices(n, 1)
+    phi = np.dot(x, z) + np.dot((np.pi-x[:, i])*(np.pi-x[:, j]), z[i]*z[j])
+    Uu = np.exp(1j*phi)
+    Hn = 1
+    for k in range(n):
+        Hn = np.kron(Hn, np.array([[1, 1], [1, -1]])/np.sqrt(2))
+    # H^n |0>^n is the uniform vector, H^n is symmetric
+    psi = Uu/np.sqrt(2**n)
+    for k in range(reps-1):
+        psi = Uu*np.dot(psi, Hn)
+    return psi
 
-    label_train = np.zeros(2*(training_size+test_size))
-    sample_train = []
-    sampleA = [[0 for x in range(n)] for y in range(training_size+test_size)]
-    sampleB = [[0 for x in range(n)] for y in range(training_size+test_size)]
 
-    sample_Total = [[[0 for x in range(N)] for y in range(N)] for z in range(N)]
+def _ad_hoc_expectations(x, M):
+    """<psi(x)|M|psi(x)> of the ad-hoc feature map for every row of x."""
+    psi = feature_map_states(x)
+    return np.real(np.sum(psi.conj()*np.dot(psi, M.T), axis=1))
 
-    interactions = np.transpose(np.array([[1, 0], [0, 1], [1, 1]]))
 
-    steps = 2*np.pi/N
+def ad_hoc_grid_size(n):
+    """Default number of grid points per feature of ad_hoc_data: 100 for n=2, 20 for
+    n=3 and the finest grid of at most 10**6 points for larger n."""
+    if n == 2:
+        return 100
+    if n == 3:
+        return 20
+    N = 2
+    while (N+1)**n <= 10**6:
+        N += 1
+    return N
+
+
+def ad_hoc_class_indices(sample_Total):
+    """Flat indices of the grid cells of class A (+1) and class B (-1) of sample_Total."""
+    labels = np.asarray(sample_Total).reshape(-1)
+    return np.flatnonzero(labels == 1), np.flatnonzero(labels == -1)
+
+
+def _sample_ad_hoc_class(shape, cells, size, replace):
+    """size feature vectors drawn uniformly from the flat grid indices cells in a single
+    call, so the cost does not depend on how many cells the gap leaves."""
+    if len(cells) == 0:
+        raise ValueError('The grid has no points of this class, lower the gap.')
+    draws = np.random.choice(cells, size, replace=replace)
+    return 2*np.pi*np.stack(np.unravel_index(draws, shape), axis=1)/shape[0]
+
+
+def ad_hoc_data(training_size, test_size, n, gap, PLOT_DATA, N=None, chunk_size=None,
+                grid_file=None, replace=True):
+    """
+    Ad-hoc dataset of n features separated by the expectation of a random observable
+    in the ZZ feature map state. The N**n label grid is evaluated in chunks of
+    chunk_size points (default 2**16 // 2**n, 1 MB of amplitudes per array) and
+    stored as int8, so 5 - 8 feature datasets fit in memory.
+
+    N: Number of grid points per feature, defaults to ad_hoc_grid_size(n).
+    chunk_size: Number of grid points evaluated at once.
+    grid_file: Path of a .npy file the label grid is memory-mapped to, None to keep it
+               in memory.
+    replace: Whether the samples of a class are drawn with replacement.
+
+    Returns sample_Total, the (N,)*n int8 grid of +1 (A), -1 (B) and 0 (inside the
+    gap) labels, training_input, test_input and class_labels.
+    """
+    class_labels = [r'A', r'B']
+    if N is None:
+        N = ad_hoc_grid_size(n)   # courseness of data seperation
+    if chunk_size is None:
+        chunk_size = max(1, 2**16 // 2**n)
 
-    sx = np.array([[0, 1], [1, 0]])
-    X = np.asmatrix(sx)
-    sy = np.array([[0, -1j], [1j, 0]])
-    Y = np.asmatrix(sy)
-    sz = np.array([[1, 0], [0, -1]])
-    Z = np.asmatrix(sz)
-    J = np.array([[1, 0], [0, 1]])
-    J = np.asmatrix(J)
-    H = np.array([[1, 1], [1, -1]])/np.sqrt(2)
-    H2 = np.kron(H, H)
-    H3 = np.kron(H, H2)
-    H = np.asmatrix(H)
-    H2 = np.asmatrix(H2)
-    H3 = np.asmatrix(H3)
+    label_train = np.zeros(2*(training_size+test_size))
+
+    steps = 2*np.pi/N
 
     f = np.arange(2**n)
 
@@ -71,13 +132,12 @@ def ad_hoc_data(training_size, test_size, n, gap, PLOT_DATA):
     my_array = np.asarray(my_array)
     my_array = np.transpose(my_array)
 
-    # Define decision functions
+    # Define decision functions, both are traceless for the n they are used with
     maj = (-1)**(2*my_array.sum(axis=0) > n)
     parity = (-1)**(my_array.sum(axis=0))
-    dict1 = (-1)**(my_array[0])
-    if n == 2:
+    if n % 2 == 0:
         D = np.diag(parity)
-    elif n == 3:
+    else:
         D = np.diag(maj)
 
     Basis = np.random.random((2**n, 2**n)) + 1j*np.random.random((2**n, 2**n))
@@ -90,196 +150,108 @@ def ad_hoc_data(training_size, test_size, n, gap, PLOT_DATA):
     U = U[:, idx]
 
     M = (np.asmatrix(U)).getH()*np.asmatrix(D)*np.asmatrix(U)
+    M = np.asarray(M)
 
-    psi_plus = np.transpose(np.ones(2))/np.sqrt(2)
-    psi_0 = 1
-    for k in range(n):
-        psi_0 = np.kron(np.asmatrix(psi_0), np.asmatrix(psi_plus))
-
-    sample_total_A = []
-    sample_total_B = []
-    sample_total_void = []
-    if n == 2:
-        for n1 in range(N):
-            for n2 in range(N):
-                x1 = steps*n1
-                x2 = steps*n2
-                phi = x1*np.kron(Z, J) + x2*np.kron(J, Z) + (np.pi-x1)*(np.pi-x2)*np.kron(Z, Z)
-                Uu = scipy.linalg.expm(1j*phi)
-                psi = np.asmatrix(Uu)*H2*np.asmatrix(Uu)*np.transpose(psi_0)
-                temp = np.asscalar(np.real(psi.getH()*M*psi))
-                if temp > gap:
-                    sample_Total[n1][n2] = +1
-                elif temp < -gap:
-                    sample_Total[n1][n2] = -1
-                else:
-                    sample_Total[n1][n2] = 0
-
-        # Now sample randomly from sample_Total a number of times training_size+testing_size
-        tr = 0
-        while tr < (training_size+test_size):
-            draw1 = np.random.choice(N)
-            draw2 = np.random.choice(N)
-            if sample_Total[draw1][draw2] == +1:
-                sampleA[tr] = [2*np.pi*draw1/N, 2*np.pi*draw2/N]
-                tr += 1
-
-        tr = 0
-        while tr < (training_size+test_size):
-            draw1 = np.random.choice(N)
-            draw2 = np.random.choice(N)
-            if sample_Total[draw1][draw2] == -1:
-                sampleB[tr] = [2*np.pi*draw1/N, 2*np.pi*draw2/N]
-                tr += 1
-
-        sample_train = [sampleA, sampleB]
-
-        for lindex in range(training_size+test_size):
-            label_train[lindex] = 0
-        for lindex in range(training_size+test_size):
-            label_train[training_size+test_size+lindex] = 1
-        label_train = label_train.astype(int)
-        sample_train = np.reshape(sample_train, (2*(training_size+test_size), n))
-        training_input = {key: (sample_train[label_train == k, :])[:training_size]
-                          for k, key in enumerate(class_labels)}
-        test_input = {key: (sample_train[label_train == k, :])[training_size:(
-            training_size+test_size)] for k, key in enumerate(class_labels)}
-
-        if PLOT_DATA:
-            img = plt.imshow(np.asmatrix(sample_Total).T, interpolation='nearest',
-                             origin='lower', cmap='copper', extent=[0, 2*np.pi, 0, 2*np.pi])
-            plt.show()
-            fig2 = plt.figure()
-            for k in range(0, 2):
-                plt.scatter(sample_train[label_train == k, 0][:training_size],
-                            sample_train[label_train == k, 1][:training_size])
-
-            plt.title("Ad-hoc Data")
-            plt.show()
+    # Label the N**n grid chunk by chunk, in the order of nested loops over n1, n2, ...
+    if grid_file is None:
+        sample_Total = np.empty((N,)*n, dtype=np.int8)
+    else:
+        sample_Total = np.lib.format.open_memmap(grid_file, mode='w+', dtype=np.int8,
+                                                 shape=(N,)*n)
+    labels = sample_Total.reshape(-1)
+    for start in range(0, N**n, chunk_size):
+        points = np.arange(start, min(start+chunk_size, N**n))
+        grid = np.stack(np.unravel_index(points, (N,)*n), axis=1)
+        temp = _ad_hoc_expectations(steps*grid, M)
+        labels[points] = np.where(temp > gap, 1, np.where(temp < -gap, -1, 0))
+    if grid_file is not None:
+        sample_Total.flush()
+
+    # Now sample randomly from sample_Total a number of times training_size+testing_size
+    cellsA, cellsB = ad_hoc_class_indices(sample_Total)
+    sampleA = _sample_ad_hoc_class(sample_Total.shape, cellsA, training_size+test_size, replace)
+    sampleB = _sample_ad_hoc_class(sample_Total.shape, cellsB, training_size+test_size, replace)
 
-    elif n == 3:
-        for n1 in range(N):
-            for n2 in range(N):
-                for n3 in range(N):
-                    x1 = steps*n1
-                    x2 = steps*n2
-                    x3 = steps*n3
-                    phi = x1*np.kron(np.kron(Z, J), J) + x2*np.kron(np.kron(J, Z), J) + x3*np.kron(np.kron(J, J), Z) + \
-                        (np.pi-x1)*(np.pi-x2)*np.kron(np.kron(Z, Z), J)+(np.pi-x2)*(np.pi-x3)*np.kron(np.kron(J, Z), Z) + \
-                        (np.pi-x1)*(np.pi-x3)*np.kron(np.kron(Z, J), Z)
-                    Uu = scipy.linalg.expm(1j*phi)
-                    psi = np.asmatrix(Uu)*H3*np.asmatrix(Uu)*np.transpose(psi_0)
-                    temp = np.asscalar(np.real(psi.getH()*M*psi))
-                    if temp > gap:
-                        sample_Total[n1][n2][n3] = +1
-                        sample_total_A.append([n1, n2, n3])
-                    elif temp < -gap:
-                        sample_Total[n1][n2][n3] = -1
-                        sample_total_B.append([n1, n2, n3])
-                    else:
-                        sample_Total[n1][n2][n3] = 0
-                        sample_total_void.append([n1, n2, n3])
-
-        # Now sample randomly from sample_Total a number of times training_size+testing_size
-        tr = 0
-        while tr < (training_size+test_size):
-            draw1 = np.random.choice(N)
-            draw2 = np.random.choice(N)
-            draw3 = np.random.choice(N)
-            if sample_Total[draw1][draw2][draw3] == +1:
-                sampleA[tr] = [2*np.pi*draw1/N, 2*np.pi*draw2/N, 2*np.pi*draw3/N]
-                tr += 1
-
-        tr = 0
-        while tr < (training_size+test_size):
-            draw1 = np.random.choice(N)
-            draw2 = np.random.choice(N)
-            draw3 = np.random.choice(N)
-            if sample_Total[draw1][draw2][draw3] == -1:
-                sampleB[tr] = [2*np.pi*draw1/N, 2*np.pi*draw2/N, 2*np.pi*draw3/N]
-                tr += 1
+    sample_train = [sampleA, sampleB]
 
-        sample_train = [sampleA, sampleB]
+    for lindex in range(training_size+test_size):
+        label_train[lindex] = 0
+    for lindex in range(training_size+test_size):
+        label_train[training_size+test_size+lindex] = 1
+    label_train = label_train.astype(int)
+    sample_train = np.reshape(sample_train, (2*(training_size+test_size), n))
+    training_input = {key: (sample_train[label_train == k, :])[:training_size]
+                      for k, key in enumerate(class_labels)}
+    test_input = {key: (sample_train[label_train == k, :])[training_size:(
+        training_size+test_size)] for k, key in enumerate(class_labels)}
 
-        for lindex in range(training_size+test_size):
-            label_train[lindex] = 0
-        for lindex in range(training_size+test_size):
-            label_train[training_size+test_size+lindex] = 1
-        label_train = label_train.astype(int)
-        sample_train = np.reshape(sample_train, (2*(training_size+test_size), n))
-        training_input = {key: (sample_train[label_train == k, :])[:training_size]
-                          for k, key in enumerate(class_labels)}
-        test_input = {key: (sample_train[label_train == k, :])[training_size:(
-            training_size+test_size)] for k, key in enumerate(class_labels)}
+    if PLOT_DATA and n == 2:
+        plt.imshow(sample_Total.T, interpolation='nearest',
+                   origin='lower', cmap='copper', extent=[0, 2*np.pi, 0, 2*np.pi])
+        plt.show()
+        plt.figure()
+        for k in range(0, 2):
+            plt.scatter(sample_train[label_train == k, 0][:training_size],
+                        sample_train[label_train == k, 1][:training_size])
 
-        if PLOT_DATA:
+        plt.title("Ad-hoc Data")
+        plt.show()
 
-            sample_total_A = np.asarray(sample_total_A)
-            sample_total_B = np.asarray(sample_total_B)
-            x1 = sample_total_A[:, 0]
-            y1 = sample_total_A[:, 1]
-            z1 = sample_total_A[:, 2]
+    elif PLOT_DATA and n == 3:
+        sample_total_A = np.argwhere(sample_Total == 1)
+        sample_total_B = np.argwhere(sample_Total == -1)
+        x1 = sample_total_A[:, 0]
+        y1 = sample_total_A[:, 1]
+        z1 = sample_total_A[:, 2]
 
-            x2 = sample_total_B[:, 0]
-            y2 = sample_total_B[:, 1]
-            z2 = sample_total_B[:, 2]
+        x2 = sample_total_B[:, 0]
+        y2 = sample_total_B[:, 1]
+        z2 = sample_total_B[:, 2]
 
-            fig1 = plt.figure()
-            ax1 = fig1.add_subplot(1, 1, 1, projection='3d')
-            ax1.scatter(x1, y1, z1, c='#8A360F')
-            plt.show()
-        #
-            fig2 = plt.figure()
-            ax2 = fig2.add_subplot(1, 1, 1, projection='3d')
-            ax2.scatter(x2, y2, z2, c='#683FC8')
-            plt.show()
+        fig1 = plt.figure()
+        ax1 = fig1.add_subplot(1, 1, 1, projection='3d')
+        ax1.scatter(x1, y1, z1, c='#8A360F')
+        plt.show()
+    #
+        fig2 = plt.figure()
+        ax2 = fig2.add_subplot(1, 1, 1, projection='3d')
+        ax2.scatter(x2, y2, z2, c='#683FC8')
+        plt.show()
 
-            sample_training_A = training_input['A']
-            sample_training_B = training_input['B']
+        sample_training_A = training_input['A']
+        sample_training_B = training_input['B']
 
-            x1 = sample_training_A[:, 0]
-            y1 = sample_training_A[:, 1]
-            z1 = sample_training_A[:, 2]
+        x1 = sample_training_A[:, 0]
+        y1 = sample_training_A[:, 1]
+        z1 = sample_training_A[:, 2]
 
-            x2 = sample_training_B[:, 0]
-            y2 = sample_training_B[:, 1]
-            z2 = sample_training_B[:, 2]
+        x2 = sample_training_B[:, 0]
+        y2 = sample_training_B[:, 1]
+        z2 = sample_training_B[:, 2]
 
-            fig1 = plt.figure()
-            ax1 = fig1.add_subplot(1, 1, 1, projection='3d')
-            ax1.scatter(x1, y1, z1, c='#8A360F')
-            ax1.scatter(x2, y2, z2, c='#683FC8')
-            plt.show()
+        fig1 = plt.figure()
+        ax1 = fig1.add_subplot(1, 1, 1, projection='3d')
+        ax1.scatter(x1, y1, z1, c='#8A360F')
+        ax1.scatter(x2, y2, z2, c='#683FC8')
+        plt.show()
 
     return sample_Total, training_input, test_input, class_labels
 
 
-def sample_ad_hoc_data(sample_Total, test_size, n):
-    tr = 0
-
+def sample_ad_hoc_data(sample_Total, test_size, n, replace=True, class_indices=None):
+    """
+    Draws a new test set of test_size points per class from the label grid of
+    ad_hoc_data. Pass class_indices from ad_hoc_class_indices(sample_Total) to skip
+    scanning the grid on repeated calls.
+    """
     class_labels = [r'A', r'B']  # copied from ad_hoc_data()
-    if n == 2:
-        N = 100
-    elif n == 3:
-        N = 20
+    sample_Total = np.asarray(sample_Total)
+    if class_indices is None:
+        class_indices = ad_hoc_class_indices(sample_Total)
 
     label_train = np.zeros(2*test_size)
-    sampleA = [[0 for x in range(n)] for y in range(test_size)]
-    sampleB = [[0 for x in range(n)] for y in range(test_size)]
-    while tr < (test_size):
-        draw1 = np.random.choice(N)
-        draw2 = np.random.choice(N)
-        if sample_Total[draw1][draw2] == +1:
-            sampleA[tr] = [2*np.pi*draw1/N, 2*np.pi*draw2/N]
-            tr += 1
-
-    tr = 0
-    while tr < (test_size):
-        draw1 = np.random.choice(N)
-        draw2 = np.random.choice(N)
-        if sample_Total[draw1][draw2] == -1:
-            sampleB[tr] = [2*np.pi*draw1/N, 2*np.pi*draw2/N]
-            tr += 1
+    sampleA = _sample_ad_hoc_class(sample_Total.shape, class_indices[0], test_size, replace)
+    sampleB = _sample_ad_hoc_class(sample_Total.shape, class_indices[1], test_size, replace)
     sample_train = [sampleA, sampleB]
     for lindex in range(test_size):
         label_train[lindex] = 0
@@ -293,7 +265,7 @@ def sample_ad_hoc_data(sample_Total, test_size, n):
 
 def Breast_cancer(training_size, test_size, n, PLOT_DATA):
     class_labels = [r'A', r'B']
-    data, target = datasets.load_breast_cancer(True)
+    data, target = datasets.load_breast_cancer(return_X_y=True)
     sample_train, sample_test, label_train, label_test = train_test_split(data, target, test_size=0.3, random_state=12)
 
     # Now we standarize for gaussian around 0 with unit variance
@@ -368,7 +340,7 @@ def Digits(training_size, test_size, n, PLOT_DATA):
 
 def Iris(training_size, test_size, n, PLOT_DATA):
     class_labels = [r'A', r'B', r'C']
-    data, target = datasets.load_iris(True)
+    data, target = datasets.load_iris(return_X_y=True)
     sample_train, sample_test, label_train, label_test = train_test_split(data, target, test_size=1, random_state=42)
 
     # Now we standarize for gaussian around 0 with unit variance
@@ -401,7 +373,7 @@ def Iris(training_size, test_size, n, PLOT_DATA):
 def Wine(training_size, test_size, n, PLOT_DATA):
     class_labels = [r'A', r'B', r'C']
 
-    data, target = datasets.load_wine(True)
+    data, target = datasets.load_wine(return_X_y=True)
     sample_train, sample_test, label_train, label_test = train_test_split(data, target, test_size=0.1,
                                                                           random_state=7)
 
@@ -548,7 +520,80 @@ def Gaussian(training_size, test_size, n, PLOT_DATA):
 
         return sample_train, training_input, test_input, class_labels
     else:
-        print("Gaussian presently only supports 2 or 3 qubits")
+        raise ValueError("Gaussian presently only supports 2 or 3 qubits")
+
+
+# Bump when a generator changes its output, so older cache files are not reused
+_CACHE_VERSION = 1
+
+# Generators drawing from np.random, the others give the same data on every call
+_RANDOM_GENERATORS = (ad_hoc_data, Gaussian)
+
+
+def dataset_key(generator, training_size, test_size, n, seed=None, **options):
+    """Metadata of a generated dataset and its short hash, used as the cache file name."""
+    metadata = {'version': _CACHE_VERSION, 'generator': generator.__name__,
+                'training_size': training_size, 'test_size': test_size, 'n': n,
+                'seed': seed, 'options': options}
+    text = json.dumps(metadata, sort_keys=True)
+    return metadata, hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def cached_dataset(generator, training_size, test_size, n, seed=None, cache_dir='qsvm_cache',
+                   **options):
+    """
+    Returns generator(training_size, test_size, n, PLOT_DATA=False, **options) from an
+    NPZ file in cache_dir, generating and saving it on the first call. The file name is a
+    hash of the generator name, sizes, n, options (e.g. gap) and seed, so any change
+    regenerates the data.
+
+    generator: One of ad_hoc_data, Breast_cancer, Digits, Iris, Wine or Gaussian.
+    seed: Seed of the random generators ad_hoc_data and Gaussian. With None they are
+          run on the global random state and neither read from nor written to the
+          cache, so unseeded calls stay random. Otherwise they are run on a seeded
+          np.random state and the global state is restored afterwards, so a cache hit
+          and a miss leave np.random alike. Breast_cancer, Digits, Iris and Wine split
+          their data with fixed seeds and are cached whatever seed is.
+    cache_dir: Directory of the cache files.
+
+    Returns the same tuple as the generator. For ad_hoc_data the first item is the label
+    grid sample_Total, so sample_ad_hoc_data can draw new test sets from a cached
+    dataset without regenerating it.
+    """
+    if generator not in _RANDOM_GENERATORS:
+        seed = None
+    elif seed is None:
+        return generator(training_size, test_size, n, PLOT_DATA=False, **options)
+    metadata, key = dataset_key(generator, training_size, test_size, n, seed, **options)
+    path = os.path.join(cache_dir, '%s_%s.npz' % (generator.__name__, key))
+    if os.path.exists(path):
+        with np.load(path) as data:
+            class_labels = [str(label) for label in data['class_labels']]
+            training_input = {label: data['training_' + label] for label in class_labels}
+            test_input = {label: data['test_' + label] for label in class_labels}
+            return data['samples'], training_input, test_input, class_labels
+
+    state = np.random.get_state()
+    if seed is not None:
+        np.random.seed(seed)
+    try:
+        samples, training_input, test_input, class_labels = generator(
+            training_size, test_size, n, PLOT_DATA=False, **options)
+    finally:
+        np.random.set_state(state)
+
+    arrays = {'samples': np.asarray(samples), 'class_labels': np.array(class_labels),
+              'metadata': np.array(json.dumps(metadata, sort_keys=True))}
+    for label in class_labels:
+        arrays['training_' + label] = training_input[label]
+        arrays['test_' + label] = test_input[label]
+    os.makedirs(cache_dir, exist_ok=True)
+    # np.load of a file another process is still writing fails, os.replace swaps the
+    # finished file in at once
+    partial = '%s.%d.npz' % (path[:-4], os.getpid())
+    np.savez(partial, **arrays)
+    os.replace(partial, path)
+    return samples, training_input, test_input, class_labels
 
 
 if __name__ == '__main__':
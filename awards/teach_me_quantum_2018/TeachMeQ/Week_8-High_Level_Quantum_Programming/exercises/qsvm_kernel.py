@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 IBM.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+"""
+Kernel matrices K[i, j] = |<psi(x_i)|psi(y_j)>|^2 of the ad-hoc (ZZ) feature map, the
+kernel QSVM trains on, for the datasets of qsvm_datasets.py.
+
+The feature map states of all samples are computed in one batch, the Gram matrix is
+formed block by block with matrix products and training kernels only compute the
+blocks on and above the diagonal. The blocks can be written to a memory-mapped array,
+so M in the tens of thousands does not need the whole kernel in memory:
+
+    out = np.lib.format.open_memmap('kernel.npy', mode='w+', dtype=np.float32,
+                                    shape=(len(x), len(x)))
+    kernel_matrix(x, out=out)
+"""
+
+import numpy as np
+
+from qsvm_datasets import feature_map_states
+
+
+def kernel_inputs(inputs, class_labels=None):
+    """
+    Stacks the per class samples of a training_input or test_input dict.
+
+    Returns the (M, n) samples and the (M,) integer labels, the index of the class in
+    class_labels (default: the order of the dict).
+    """
+    if class_labels is None:
+        class_labels = list(inputs)
+    x = np.concatenate([inputs[key] for key in class_labels])
+    labels = np.concatenate([np.full(len(inputs[key]), k) for k, key in enumerate(class_labels)])
+    return x, labels
+
+
+def kernel_matrix(x, y=None, reps=2, block_size=1024, out=None):
+    """
+    Kernel matrix of the ad-hoc feature map between the rows of x and y.
+
+    x: (M, n) array of samples.
+    y: (M', n) array of samples, None for the symmetric training kernel of x with
+       itself, where only the blocks on and above the diagonal are computed and the
+       lower blocks are mirrored.
+    reps: Number of layers of the feature map, at least 1.
+    block_size: Number of rows and columns of a block, a block product holds
+                block_size**2 complex overlaps.
+    out: (M, M') array the blocks are written to, e.g. a memory-mapped .npy file for
+         out-of-core kernels, None to allocate a float64 array.
+
+    Returns the kernel, out if given.
+    """
+    states_x = feature_map_states(x, reps)
+    states_y = states_x if y is None else feature_map_states(y, reps)
+    if out is None:
+        out = np.empty((len(states_x), len(states_y)))
+    for row in range(0, len(states_x), block_size):
+        rows = slice(row, row+block_size)
+        bra = states_x[rows].conj()
+        # symmetric kernels start at the diagonal block
+        for col in range(row if y is None else 0, len(states_y), block_size):
+            cols = slice(col, col+block_size)
+            overlaps = np.dot(bra, states_y[cols].T)
+            block = overlaps.real**2 + overlaps.imag**2
+            out[rows, cols] = block
+            if y is None and col != row:
+                out[cols, rows] = block.T
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def qsvm_kernels(training_input, test_input, class_labels=None, reps=2, block_size=1024):
+    """
+    Training and test kernels of a dataset from qsvm_datasets.py.
+
+    Returns the (M, M) training kernel, the (M_test, M) test kernel and the integer
+    labels of the training and test samples.
+    """
+    x, training_labels = kernel_inputs(training_input, class_labels)
+    y, test_labels = kernel_inputs(test_input, class_labels)
+    training_kernel = kernel_matrix(x, reps=reps, block_size=block_size)
+    test_kernel = kernel_matrix(y, x, reps=reps, block_size=block_size)
+    return training_kernel, test_kernel, training_labels, test_labels
@@ -0,0 +1,161 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Benchmarks for the construction and simulation of the Ansatz circuits.
+
+Run from this folder, e.g.::
+
+    python ansatz_benchmarks.py --circuit-ids 1 5 13 --feature-dims 4 8
+    python ansatz_benchmarks.py --output results.json
+
+Every case reports the wall time (best of ``--repeat`` runs) and the peak
+memory allocated while it runs:
+
+- ``get_ansatz``: one random instance, as variational workloads build them
+  (circuits 5 and 6 bind their cached template).
+- ``get_template``: the parameterized template, built with an empty cache.
+- ``bind_parameters``: ``--samples`` instances bound into the cached template.
+- ``nlocal``: the NLocal reference construction of circuits 5 and 6.
+- ``simulate``: ``--samples`` statevectors of the batched simulator, up to
+  ``--max-sim-qubits`` qubits.
+"""
+
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import parametric_circuits
+from ansatz_simulator import compile_ansatz, simulate_statevectors
+from benchmark_utils import append_history, measure
+from parametric_circuits import ANSATZ_REGISTRY, Ansatz
+
+
+def _cold_template(ansatz: Ansatz) -> Any:
+    parametric_circuits._TEMPLATE_CACHE.clear()
+    return ansatz.get_template()
+
+
+def benchmark_cases(
+    ansatz: Ansatz, samples: int, max_sim_qubits: int
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Returns:
+        cases: (benchmark name, function) pairs measured for one configuration.
+    """
+
+    values = np.random.RandomState(0).randn(samples, ansatz.num_parameters())
+    cases = [
+        ("get_ansatz", ansatz.get_ansatz),
+        ("get_template", lambda: _cold_template(ansatz)),
+        ("bind_parameters", lambda: ansatz.bind_parameters(values)),
+    ]
+    if ansatz.circuit_id in (5, 6):
+        gate = "crz" if ansatz.circuit_id == 5 else "crx"
+        cases.append(
+            ("nlocal", lambda: ansatz._get_nlocal_circ(values[0], gate).decompose())
+        )
+    if ansatz.feature_dim <= max_sim_qubits:
+        gates, num_qubits, _ = compile_ansatz(ansatz)
+        cases.append(
+            ("simulate", lambda: simulate_statevectors(gates, num_qubits, values))
+        )
+    return cases
+
+
+def run_benchmarks(
+    circuit_ids: Sequence[int],
+    feature_dims: Sequence[int],
+    repititions: Sequence[int],
+    samples: int = 100,
+    max_sim_qubits: int = 12,
+    repeat: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Returns:
+        results: One row per benchmark and configuration.
+    """
+
+    results = []
+    for circuit_id in circuit_ids:
+        for feature_dim in feature_dims:
+            for repitition in repititions:
+                ansatz = Ansatz(repitition, feature_dim, circuit_id)
+                for name, func in benchmark_cases(ansatz, samples, max_sim_qubits):
+                    seconds, peak = measure(func, repeat)
+                    results.append(
+                        {
+                            "benchmark": name,
+                            "circuit_id": circuit_id,
+                            "feature_dim": feature_dim,
+                            "repitition": repitition,
+                            "seconds": seconds,
+                            "peak_bytes": peak,
+                        }
+                    )
+    return results
+
+
+def _print_results(results: List[Dict[str, Any]]) -> None:
+    for row in results:
+        print(
+            "%-16s id=%-3d n=%-3d reps=%-3d %10.4f s %10.2f MiB"
+            % (
+                row["benchmark"],
+                row["circuit_id"],
+                row["feature_dim"],
+                row["repitition"],
+                row["seconds"],
+                row["peak_bytes"] / 2**20,
+            )
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--circuit-ids", type=int, nargs="+", default=list(ANSATZ_REGISTRY)
+    )
+    parser.add_argument(
+        "--feature-dims", type=int, nargs="+", default=[2, 4, 8, 16, 32]
+    )
+    parser.add_argument(
+        "--repititions", type=int, nargs="+", default=list(range(1, 11))
+    )
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--max-sim-qubits", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output",
+        help="append the results to this JSON file to keep a history of runs",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.circuit_ids,
+        args.feature_dims,
+        args.repititions,
+        args.samples,
+        args.max_sim_qubits,
+        args.repeat,
+    )
+    _print_results(results)
+
+    if args.output:
+        import qiskit
+
+        append_history(args.output, results, qiskit=qiskit.__version__)
+
+
+if __name__ == "__main__":
+    main()
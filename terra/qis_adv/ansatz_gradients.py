@@ -0,0 +1,196 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Batched parameter-shift gradients of the Ansatz circuits"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+from ansatz_simulator import Gate, compile_ansatz, simulate_statevectors
+from parametric_circuits import Ansatz
+
+# (shift, coefficient) pairs of the parameter-shift rules, single qubit rotations have
+# two eigenvalues and controlled rotations three, which needs the four term rule
+_C_PLUS = (np.sqrt(2) + 1) / (4 * np.sqrt(2))
+_C_MINUS = (np.sqrt(2) - 1) / (4 * np.sqrt(2))
+SHIFT_RULES = {
+    "rx": ((np.pi / 2, 0.5), (-np.pi / 2, -0.5)),
+    "ry": ((np.pi / 2, 0.5), (-np.pi / 2, -0.5)),
+    "rz": ((np.pi / 2, 0.5), (-np.pi / 2, -0.5)),
+    "crx": (
+        (np.pi / 2, _C_PLUS),
+        (-np.pi / 2, -_C_PLUS),
+        (3 * np.pi / 2, -_C_MINUS),
+        (-3 * np.pi / 2, _C_MINUS),
+    ),
+}
+SHIFT_RULES["crz"] = SHIFT_RULES["crx"]
+
+
+def z_observable(num_qubits: int, qubits: Tuple[int, ...] = (0,)) -> np.ndarray:
+    """
+    Returns:
+        diagonal: Diagonal of the Pauli Z product on qubits, in qiskit's little endian
+                  ordering.
+    """
+
+    index = np.arange(2**num_qubits)
+    parity = np.zeros(2**num_qubits, dtype=int)
+    for qubit in qubits:
+        parity ^= (index >> qubit) & 1
+    return 1.0 - 2.0 * parity
+
+
+def expectation_values(statevectors: np.ndarray, observable: np.ndarray) -> np.ndarray:
+    """
+    Args:
+        statevectors: Array of shape (samples, 2**num_qubits).
+        observable: Hermitian matrix, or a 1d array holding the diagonal of a diagonal
+                    observable.
+
+    Returns:
+        values: <psi|O|psi> of every sample.
+    """
+
+    if observable.ndim == 1:
+        return np.abs(statevectors) ** 2 @ observable
+    return np.real(
+        np.einsum("si,ij,sj->s", statevectors.conj(), observable, statevectors)
+    )
+
+
+def _unshare_parameters(gates: List[Gate]) -> Tuple[List[Gate], np.ndarray]:
+    """
+    Gives every parametric gate its own parameter, parameters shared between gates
+    (circuits 5 and 6) have to be shifted one gate at a time.
+
+    Returns:
+        gates: Gate list whose parametric gate k reads parameter k.
+        index: Parameter of the original vector read by parametric gate k.
+    """
+
+    unshared, index = [], []
+    for name, qubits, param in gates:
+        if param >= 0:
+            unshared.append((name, qubits, len(index)))
+            index.append(param)
+        else:
+            unshared.append((name, qubits, param))
+    return unshared, np.array(index, dtype=int)
+
+
+def parameter_shift_gradients(
+    gates: List[Gate],
+    num_qubits: int,
+    values: np.ndarray,
+    observable: Optional[np.ndarray] = None,
+    batch_size: int = 64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact gradients of the cost <psi(theta)|O|psi(theta)> by the parameter-shift rule.
+    All shifted parameter sets of a batch of samples are built as one array and
+    simulated in a single vectorized pass.
+
+    Args:
+        gates: Gate list from compile_circuit or compile_ansatz.
+        num_qubits: Number of qubits of the circuit.
+        values: Array of shape (samples, num_parameters).
+        observable: Observable O as accepted by expectation_values, Z on qubit 0 by
+                    default.
+        batch_size: Number of samples whose shifted sets are simulated together.
+
+    Returns:
+        costs: Array of shape (samples,) with the cost of every sample.
+        gradients: Array of shape (samples, num_parameters).
+    """
+
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    samples, num_parameters = values.shape
+    if observable is None:
+        observable = z_observable(num_qubits)
+    unshared, index = _unshare_parameters(gates)
+    names = [name for name, _, param in unshared if param >= 0]
+
+    # one row per (parametric gate, shift term), the first row is the unshifted cost
+    rows, shifts, coefficients = [0], [0.0], [0.0]
+    for gate, name in enumerate(names):
+        for shift, coefficient in SHIFT_RULES[name]:
+            rows.append(gate)
+            shifts.append(shift)
+            coefficients.append(coefficient)
+    rows, shifts, coefficients = map(np.array, (rows, shifts, coefficients))
+
+    costs = np.empty(samples)
+    gradients = np.zeros((samples, num_parameters))
+    for start in range(0, samples, batch_size):
+        batch = values[start : start + batch_size][:, index]
+        # (batch, terms, gates) array of shifted parameter sets
+        shifted = np.repeat(batch[:, None, :], len(rows), axis=1)
+        shifted[:, np.arange(len(rows)), rows] += shifts
+        states = simulate_statevectors(
+            unshared, num_qubits, shifted.reshape(-1, len(index))
+        )
+        energies = expectation_values(states, observable).reshape(len(batch), -1)
+        costs[start : start + len(batch)] = energies[:, 0]
+        # per gate derivatives, summed into the parameters the gates share
+        per_gate = np.zeros((len(index), len(batch)))
+        np.add.at(per_gate, rows[1:], (energies[:, 1:] * coefficients[1:]).T)
+        per_parameter = np.zeros((num_parameters, len(batch)))
+        np.add.at(per_parameter, index, per_gate)
+        gradients[start : start + len(batch)] = per_parameter.T
+    return costs, gradients
+
+
+def ansatz_gradients(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    samples: int = 100,
+    observable: Optional[np.ndarray] = None,
+    batch_size: int = 64,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Parameter-shift gradients of an ansatz at random initializations, drawn with the
+    standard normal distribution get_ansatz uses, e.g. for the gradient variance of
+    barren plateau studies.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        samples: Number of random initializations.
+        observable: Observable of the cost, Z on qubit 0 by default.
+        batch_size: Number of samples whose shifted sets are simulated together.
+        seed: Seed of the random parameters.
+
+    Returns:
+        result: "values" (samples, num_params), "costs" (samples,), "gradients"
+                (samples, num_params) and "variance", the variance over samples of
+                every gradient component.
+    """
+
+    rng = np.random.default_rng(seed)
+    gates, num_qubits, num_parameters = compile_ansatz(
+        Ansatz(repitition, feature_dim, circuit_id)
+    )
+    values = rng.standard_normal((samples, num_parameters))
+    costs, gradients = parameter_shift_gradients(
+        gates, num_qubits, values, observable, batch_size
+    )
+    return {
+        "values": values,
+        "costs": costs,
+        "gradients": gradients,
+        "variance": np.var(gradients, axis=0),
+    }
@@ -0,0 +1,424 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Expressibility and entangling capability of the Ansatz circuits"""
+
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+
+from ansatz_simulator import CompactCircuit, compile_ansatz, simulate_statevectors
+from parametric_circuits import Ansatz
+
+# distributions of the random parameters, "uniform" on [0, 2 pi) as in
+# https://doi.org/10.1007/s42484-021-00038-w and "normal" as get_ansatz draws them
+DISTRIBUTIONS = ("uniform", "normal")
+
+
+def random_parameters(
+    rng: np.random.Generator, shape: Tuple[int, ...], distribution: str = "uniform"
+) -> np.ndarray:
+    """
+    Args:
+        rng: Random generator.
+        shape: Shape of the parameter array, e.g. (samples, num_parameters).
+        distribution: One of DISTRIBUTIONS.
+
+    Returns:
+        values: Random parameters of the given shape.
+    """
+
+    if distribution == "uniform":
+        return rng.uniform(0, 2 * np.pi, shape)
+    if distribution == "normal":
+        return rng.standard_normal(shape)
+    raise ValueError(
+        f"Unknown distribution {distribution}, available are {DISTRIBUTIONS}"
+    )
+
+
+def haar_fidelity_probabilities(num_qubits: int, bins: int) -> np.ndarray:
+    """
+    Args:
+        num_qubits: Number of qubits.
+        bins: Number of equal width fidelity bins on [0, 1].
+
+    Returns:
+        probabilities: Probability of each bin under the fidelity distribution
+                       (N - 1)(1 - F)^(N - 2), N = 2**num_qubits, of Haar random states,
+                       at least the smallest positive float.
+    """
+
+    # difference of the survival function, 1 - cdf underflows in the upper bins
+    survival = (1 - np.linspace(0, 1, bins + 1)) ** (2**num_qubits - 1)
+    # for many qubits the upper bins still underflow to 0, the floor keeps the KL
+    # divergence of a histogram with counts there finite
+    return np.maximum(-np.diff(survival), np.finfo(float).tiny)
+
+
+def fidelity_histogram(fidelities: np.ndarray, bins: int) -> np.ndarray:
+    """
+    Args:
+        fidelities: Fidelities in [0, 1].
+        bins: Number of equal width bins on [0, 1].
+
+    Returns:
+        counts: Number of fidelities falling in each bin.
+    """
+
+    index = np.minimum((np.asarray(fidelities) * bins).astype(int), bins - 1)
+    return np.bincount(index, minlength=bins)
+
+
+def kl_divergence(counts: np.ndarray, haar: np.ndarray) -> float:
+    """
+    Args:
+        counts: Fidelity histogram of the circuit.
+        haar: Haar bin probabilities from haar_fidelity_probabilities.
+
+    Returns:
+        kl: KL divergence of the normalized histogram from the Haar distribution,
+            empty bins do not contribute.
+    """
+
+    prob = counts / np.sum(counts)
+    mask = prob > 0
+    return float(np.sum(prob[mask] * np.log(prob[mask] / haar[mask])))
+
+
+def _bootstrap_std(counts: np.ndarray, haar: np.ndarray, resamples: int, rng) -> float:
+    """Standard deviation of the KL divergence over multinomial resamples of counts."""
+    if resamples < 2:
+        return float("nan")
+    total = int(np.sum(counts))
+    draws = rng.multinomial(total, counts / total, size=resamples)
+    return float(np.std([kl_divergence(draw, haar) for draw in draws], ddof=1))
+
+
+def _compiled(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    circuit: Optional[CompactCircuit],
+) -> Tuple[object, int, int]:
+    """Gates, number of qubits and parameters of circuit, or of the ansatz without."""
+    if circuit is None:
+        return compile_ansatz(Ansatz(repitition, feature_dim, circuit_id))
+    return circuit, circuit.num_qubits, circuit.num_parameters
+
+
+def fidelity_samples(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    samples: int,
+    batch_size: int = 1000,
+    rng: Optional[np.random.Generator] = None,
+    distribution: str = "uniform",
+    circuit: Optional[CompactCircuit] = None,
+):
+    """
+    Generates fidelities |<psi(theta)|psi(phi)>|^2 between states of random parameter
+    pairs.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        samples: Number of parameter pairs, None for an endless stream.
+        batch_size: Number of pairs simulated together.
+        rng: Random generator, a fresh unseeded one by default.
+        distribution: Distribution of the parameters, see random_parameters.
+        circuit: CompactCircuit of the ansatz, e.g. shipped to a worker process, so
+                 the template is not built again.
+
+    Yields:
+        fidelities: Array with the fidelities of one batch of pairs.
+    """
+
+    rng = np.random.default_rng() if rng is None else rng
+    gates, num_qubits, num_parameters = _compiled(
+        circuit_id, feature_dim, repitition, circuit
+    )
+    done = 0
+    while samples is None or done < samples:
+        size = batch_size if samples is None else min(batch_size, samples - done)
+        values = random_parameters(rng, (2 * size, num_parameters), distribution)
+        states = simulate_statevectors(gates, num_qubits, values)
+        overlaps = np.einsum("ij,ij->i", states[:size].conj(), states[size:])
+        done += size
+        yield np.abs(overlaps) ** 2
+
+
+def expressibility(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    samples: int = 5000,
+    bins: int = 75,
+    batch_size: int = 1000,
+    seed: Optional[int] = None,
+    resamples: int = 200,
+    distribution: str = "uniform",
+    circuit: Optional[CompactCircuit] = None,
+) -> Dict[str, float]:
+    """
+    Expressibility of an ansatz as defined in https://doi.org/10.1007/s42484-021-00038-w,
+    the KL divergence between the fidelity distribution of random parameter pairs and
+    that of Haar random states. Lower values mean a more expressive circuit.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        samples: Number of parameter pairs.
+        bins: Number of fidelity histogram bins, the paper uses 75.
+        batch_size: Number of pairs simulated together, the histogram is updated after
+                    every batch so memory does not grow with samples.
+        seed: Seed of the random parameters.
+        resamples: Number of multinomial bootstrap resamples of the histogram used for
+                   the error estimate.
+        distribution: Distribution of the parameters, uniform on [0, 2 pi) as in the
+                      paper by default.
+        circuit: CompactCircuit of the ansatz, see fidelity_samples.
+
+    Returns:
+        result: "expressibility" (the KL divergence), "std_error" (its bootstrap
+                standard deviation) and "samples".
+
+    Raises:
+        ValueError: If samples is less than 1.
+    """
+
+    if samples < 1:
+        raise ValueError(f"Expressibility needs at least 1 sample, got {samples}")
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(bins, dtype=np.int64)
+    for fidelities in fidelity_samples(
+        circuit_id,
+        feature_dim,
+        repitition,
+        samples,
+        batch_size=batch_size,
+        rng=rng,
+        distribution=distribution,
+        circuit=circuit,
+    ):
+        counts += fidelity_histogram(fidelities, bins)
+
+    haar = haar_fidelity_probabilities(feature_dim, bins)
+    return {
+        "expressibility": kl_divergence(counts, haar),
+        "std_error": _bootstrap_std(counts, haar, resamples, rng),
+        "samples": int(np.sum(counts)),
+    }
+
+
+def streaming_kl_divergence(
+    fidelity_batches: Iterable[np.ndarray],
+    num_qubits: int,
+    tol: float = 0.01,
+    bins: int = 75,
+    min_samples: int = 500,
+    max_samples: Optional[int] = None,
+    resamples: int = 200,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, object]:
+    """
+    Consumes batches of fidelities until the KL divergence from the Haar distribution
+    is known to within tol. Only the histogram is kept, so memory is O(bins) however
+    many samples are used.
+
+    Args:
+        fidelity_batches: Iterable of fidelity arrays, e.g. fidelity_samples with
+                          samples=None.
+        num_qubits: Number of qubits of the states.
+        tol: Target bootstrap standard error of the KL divergence.
+        bins: Number of fidelity histogram bins.
+        min_samples: Number of samples used before the error is first checked.
+        max_samples: Stop after this many samples even if tol is not reached, None to
+                     run until the batches are exhausted.
+        resamples: Number of multinomial bootstrap resamples of the error estimate.
+        rng: Random generator of the bootstrap.
+
+    Returns:
+        result: "expressibility", "std_error", "samples" and "converged", whether the
+                error bound met tol.
+    """
+
+    rng = np.random.default_rng() if rng is None else rng
+    haar = haar_fidelity_probabilities(num_qubits, bins)
+    counts = np.zeros(bins, dtype=np.int64)
+    std_error = float("nan")
+    converged = False
+    for fidelities in fidelity_batches:
+        if max_samples is not None:
+            fidelities = fidelities[: max_samples - int(np.sum(counts))]
+        counts += fidelity_histogram(fidelities, bins)
+        total = int(np.sum(counts))
+        if total >= min_samples:
+            std_error = _bootstrap_std(counts, haar, resamples, rng)
+            converged = std_error <= tol
+        if converged or (max_samples is not None and total >= max_samples):
+            break
+
+    return {
+        "expressibility": kl_divergence(counts, haar),
+        "std_error": std_error,
+        "samples": int(np.sum(counts)),
+        "converged": converged,
+    }
+
+
+def streaming_expressibility(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    tol: float = 0.01,
+    bins: int = 75,
+    batch_size: int = 250,
+    min_samples: int = 500,
+    max_samples: Optional[int] = 100000,
+    seed: Optional[int] = None,
+    resamples: int = 200,
+    distribution: str = "uniform",
+) -> Dict[str, object]:
+    """
+    Expressibility with an adaptive number of samples, parameter pairs are drawn batch
+    by batch until the bootstrap standard error of the estimate is at most tol.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        tol: Target standard error of the expressibility.
+        bins: Number of fidelity histogram bins, the paper uses 75.
+        batch_size: Number of pairs simulated between two error checks.
+        min_samples: Number of pairs used before the error is first checked.
+        max_samples: Upper bound on the number of pairs, None for no bound.
+        seed: Seed of the random parameters and the bootstrap.
+        resamples: Number of bootstrap resamples of every error check.
+        distribution: Distribution of the parameters, see random_parameters.
+
+    Returns:
+        result: "expressibility", "std_error", "samples", the number of pairs used, and
+                "converged".
+    """
+
+    rng = np.random.default_rng(seed)
+    batches = fidelity_samples(
+        circuit_id,
+        feature_dim,
+        repitition,
+        None,
+        batch_size=batch_size,
+        rng=rng,
+        distribution=distribution,
+    )
+    return streaming_kl_divergence(
+        batches, feature_dim, tol, bins, min_samples, max_samples, resamples, rng
+    )
+
+
+def reduced_purities(statevectors: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Args:
+        statevectors: Array of shape (samples, 2**num_qubits).
+        num_qubits: Number of qubits.
+
+    Returns:
+        purities: Array of shape (samples, num_qubits) with Tr(rho_k^2) of the reduced
+                  state of every qubit k.
+    """
+
+    states = np.asarray(statevectors).reshape((-1,) + (2,) * num_qubits)
+    purities = np.empty((states.shape[0], num_qubits))
+    for qubit in range(num_qubits):
+        # qubit q is axis num_qubits - q, move it next to the sample axis
+        ket = np.moveaxis(states, num_qubits - qubit, 1).reshape(states.shape[0], 2, -1)
+        rho = np.einsum("sar,sbr->sab", ket, ket.conj())
+        purities[:, qubit] = np.sum(np.abs(rho) ** 2, axis=(1, 2))
+    return purities
+
+
+def meyer_wallach(statevectors: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Args:
+        statevectors: Array of shape (samples, 2**num_qubits).
+        num_qubits: Number of qubits.
+
+    Returns:
+        q_values: Meyer-Wallach measure Q = 2 (1 - 1/n sum_k Tr(rho_k^2)) of every
+                  sample.
+    """
+
+    return 2 * (1 - np.mean(reduced_purities(statevectors, num_qubits), axis=1))
+
+
+def entangling_capability(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    samples: int = 1000,
+    batch_size: int = 1000,
+    seed: Optional[int] = None,
+    distribution: str = "uniform",
+    circuit: Optional[CompactCircuit] = None,
+) -> Dict[str, object]:
+    """
+    Entangling capability of an ansatz as defined in
+    https://doi.org/10.1007/s42484-021-00038-w, the mean Meyer-Wallach measure over
+    random parameters.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        samples: Number of random parameter vectors.
+        batch_size: Number of parameter vectors simulated together.
+        seed: Seed of the random parameters.
+        distribution: Distribution of the parameters, see random_parameters.
+        circuit: CompactCircuit of the ansatz, see fidelity_samples.
+
+    Returns:
+        result: "entangling_capability" (the mean), "variance" and "values", the
+                Meyer-Wallach measure of every sample.
+
+    Raises:
+        ValueError: If samples is less than 1.
+    """
+
+    if samples < 1:
+        raise ValueError(
+            f"Entangling capability needs at least 1 sample, got {samples}"
+        )
+    rng = np.random.default_rng(seed)
+    gates, num_qubits, num_parameters = _compiled(
+        circuit_id, feature_dim, repitition, circuit
+    )
+    values = np.empty(samples)
+    for start in range(0, samples, batch_size):
+        size = min(batch_size, samples - start)
+        states = simulate_statevectors(
+            gates,
+            num_qubits,
+            random_parameters(rng, (size, num_parameters), distribution),
+        )
+        values[start : start + size] = meyer_wallach(states, num_qubits)
+    return {
+        "entangling_capability": float(np.mean(values)),
+        "variance": float(np.var(values)),
+        "values": values,
+    }
@@ -0,0 +1,293 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Batched matrix product state simulator for wide Ansatz circuits"""
+
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+
+from ansatz_metrics import random_parameters
+from ansatz_simulator import Gate, compile_ansatz
+from parametric_circuits import Ansatz
+
+_SWAP = np.eye(4)[[0, 2, 1, 3]].reshape(2, 2, 2, 2)
+
+
+def _single_qubit_matrix(name: str, theta: np.ndarray) -> np.ndarray:
+    """(samples, 2, 2) matrices of a single qubit gate, one per sample."""
+    if name == "h":
+        return np.broadcast_to(
+            np.array([[1, 1], [1, -1]]) / np.sqrt(2), theta.shape + (2, 2)
+        )
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    matrix = np.zeros(theta.shape + (2, 2), dtype=complex)
+    if name in ("rx", "crx"):
+        matrix[:, 0, 0] = matrix[:, 1, 1] = cos
+        matrix[:, 0, 1] = matrix[:, 1, 0] = -1j * sin
+    elif name == "ry":
+        matrix[:, 0, 0] = matrix[:, 1, 1] = cos
+        matrix[:, 0, 1], matrix[:, 1, 0] = -sin, sin
+    else:
+        matrix[:, 0, 0], matrix[:, 1, 1] = np.exp(-0.5j * theta), np.exp(0.5j * theta)
+    return matrix
+
+
+def _two_qubit_tensor(name: str, theta: np.ndarray) -> np.ndarray:
+    """
+    (samples, 2, 2, 2, 2) tensors [out control, out target, in control, in target]
+    of a controlled gate, one per sample.
+    """
+    if name == "cx":
+        target = np.broadcast_to(np.array([[0, 1], [1, 0]]), theta.shape + (2, 2))
+    elif name == "cz":
+        target = np.broadcast_to(np.diag([1, -1]), theta.shape + (2, 2))
+    else:
+        target = _single_qubit_matrix(name, theta)
+    tensor = np.zeros(theta.shape + (2, 2, 2, 2), dtype=complex)
+    tensor[:, 0, :, 0, :] = np.eye(2)
+    tensor[:, 1, :, 1, :] = target
+    return tensor
+
+
+class BatchedMPS:
+    """
+    Matrix product states of a batch of samples of the same circuit. Site k holds
+    qubit k as a (samples, left bond, 2, right bond) tensor, all samples share the
+    bond dimensions. The state is kept in mixed canonical form around the site
+    center, so truncating the singular values of a two site update discards the
+    smallest Schmidt coefficients of the whole state.
+    """
+
+    __slots__ = ("tensors", "center", "max_bond", "cutoff", "truncation_error")
+
+    def __init__(
+        self, num_qubits: int, samples: int, max_bond: int = 64, cutoff: float = 1e-12
+    ) -> None:
+        """
+        Args:
+            num_qubits: Number of qubits, prepared in |0...0>.
+            samples: Number of samples.
+            max_bond: Largest bond dimension kept after a two qubit gate.
+            cutoff: Singular values below cutoff times the largest one are dropped.
+        """
+        site = np.zeros((samples, 1, 2, 1), dtype=complex)
+        site[:, 0, 0, 0] = 1
+        self.tensors = [site.copy() for _ in range(num_qubits)]
+        self.center = 0
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        # summed discarded weight of every truncation, per sample
+        self.truncation_error = np.zeros(samples)
+
+    def _move_center(self, site: int) -> None:
+        """Moves the orthogonality center to site with QR decompositions."""
+        tensors = self.tensors
+        while self.center < site:
+            tensor = tensors[self.center]
+            samples, left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(samples, 2 * left, right))
+            tensors[self.center] = q.reshape(samples, left, 2, -1)
+            tensors[self.center + 1] = np.einsum(
+                "sab,sbpc->sapc", r, tensors[self.center + 1]
+            )
+            self.center += 1
+        while self.center > site:
+            tensor = tensors[self.center]
+            samples, left, _, right = tensor.shape
+            # LQ of the tensor from the QR of its conjugate transpose
+            q, r = np.linalg.qr(
+                tensor.reshape(samples, left, 2 * right).conj().swapaxes(1, 2)
+            )
+            tensors[self.center] = (
+                q.conj().swapaxes(1, 2).reshape(samples, -1, 2, right)
+            )
+            tensors[self.center - 1] = np.einsum(
+                "sapb,scb->sapc", tensors[self.center - 1], r.conj()
+            )
+            self.center -= 1
+
+    def apply_single(self, site: int, matrix: np.ndarray) -> None:
+        """Applies (samples, 2, 2) matrices to the qubit at site."""
+        self.tensors[site] = np.einsum("spq,saqb->sapb", matrix, self.tensors[site])
+
+    def _apply_adjacent(self, site: int, tensor: np.ndarray, flipped: bool) -> None:
+        """
+        Applies (samples, 2, 2, 2, 2) gate tensors to sites site and site + 1, with the
+        first gate qubit on site + 1 when flipped, and truncates the new bond.
+        """
+        self._move_center(site)
+        theta = np.einsum(
+            "sapb,sbqc->sapqc", self.tensors[site], self.tensors[site + 1]
+        )
+        if flipped:
+            theta = np.einsum("sxyuv,savuc->sayxc", tensor, theta)
+        else:
+            theta = np.einsum("sxyuv,sauvc->saxyc", tensor, theta)
+        samples, left, _, _, right = theta.shape
+        u, s, vh = np.linalg.svd(
+            theta.reshape(samples, 2 * left, 2 * right), full_matrices=False
+        )
+        norms = np.sum(s**2, axis=1)
+        kept = np.sum(s > self.cutoff * s[:, :1], axis=1)
+        bond = max(1, min(self.max_bond, int(np.max(kept))))
+        self.truncation_error += np.sum(s[:, bond:] ** 2, axis=1) / norms
+        s = s[:, :bond] * np.sqrt(norms / np.sum(s[:, :bond] ** 2, axis=1))[:, None]
+        self.tensors[site] = u[:, :, :bond].reshape(samples, left, 2, bond)
+        self.tensors[site + 1] = (s[:, :, None] * vh[:, :bond]).reshape(
+            samples, bond, 2, right
+        )
+        self.center = site + 1
+
+    def apply_two(self, control: int, target: int, tensor: np.ndarray) -> None:
+        """
+        Applies (samples, 2, 2, 2, 2) gate tensors [out control, out target,
+        in control, in target], qubits that are not neighbours are swapped next to
+        each other first and swapped back afterwards.
+        """
+        swap = np.broadcast_to(_SWAP, tensor.shape)
+        low, high = sorted((control, target))
+        # move the qubit at low up to high - 1
+        for site in range(low, high - 1):
+            self._apply_adjacent(site, swap, False)
+        self._apply_adjacent(high - 1, tensor, control > target)
+        for site in reversed(range(low, high - 1)):
+            self._apply_adjacent(site, swap, False)
+
+    def reduced_purities(self) -> np.ndarray:
+        """
+        Returns:
+            purities: Array of shape (samples, num_qubits) with Tr(rho_k^2) of every
+                      qubit, read off the canonical form one site at a time.
+        """
+        num_qubits = len(self.tensors)
+        purities = np.empty((self.tensors[0].shape[0], num_qubits))
+        for site in range(num_qubits):
+            self._move_center(site)
+            tensor = self.tensors[site]
+            rho = np.einsum("sapb,saqb->spq", tensor, tensor.conj())
+            purities[:, site] = np.sum(np.abs(rho) ** 2, axis=(1, 2))
+        return purities
+
+    def to_statevectors(self) -> np.ndarray:
+        """
+        Returns:
+            statevectors: Array of shape (samples, 2**num_qubits) in qiskit's little
+                          endian ordering, for checks on a few qubits.
+        """
+        state = self.tensors[0]
+        for tensor in self.tensors[1:]:
+            state = np.einsum(
+                "sxb,sbpc->sxpc", state.reshape(len(state), -1, state.shape[-1]), tensor
+            )
+        # site k holds qubit k, little endian wants qubit 0 as the last axis
+        num_qubits = len(self.tensors)
+        state = state.reshape((len(state),) + (2,) * num_qubits)
+        return state.transpose([0] + list(range(num_qubits, 0, -1))).reshape(
+            len(state), -1
+        )
+
+
+def simulate_mps(
+    gates: Sequence[Gate],
+    num_qubits: int,
+    values: np.ndarray,
+    max_bond: int = 64,
+    cutoff: float = 1e-12,
+) -> BatchedMPS:
+    """
+    Simulates the gate list for a batch of parameter vectors as matrix product states.
+    Nearest neighbour circuits keep a small bond dimension, so widths far beyond the
+    reach of simulate_statevectors work.
+
+    Args:
+        gates: Gate list from compile_circuit or compile_ansatz, or a CompactCircuit.
+        num_qubits: Number of qubits of the circuit.
+        values: Array of shape (samples, num_parameters), one parameter vector per row.
+        max_bond: Largest bond dimension kept, larger bonds are truncated.
+        cutoff: Relative singular value cutoff of the truncation.
+
+    Returns:
+        mps: The final states, mps.truncation_error holds the discarded weight.
+    """
+
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    mps = BatchedMPS(num_qubits, len(values), max_bond, cutoff)
+    zeros = np.zeros(len(values))
+    for name, qubits, index in gates:
+        theta = values[:, index] if index >= 0 else zeros
+        if len(qubits) == 1:
+            mps.apply_single(qubits[0], _single_qubit_matrix(name, theta))
+        else:
+            mps.apply_two(qubits[0], qubits[1], _two_qubit_tensor(name, theta))
+    return mps
+
+
+def mps_entangling_capability(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    samples: int = 1000,
+    batch_size: int = 100,
+    max_bond: int = 64,
+    cutoff: float = 1e-12,
+    seed: Optional[int] = None,
+    distribution: str = "uniform",
+) -> Dict[str, Any]:
+    """
+    Entangling capability like ansatz_metrics.entangling_capability, with the reduced
+    purities of the Meyer-Wallach measure taken from matrix product states. Meant for
+    the nearest neighbour circuits 2, 3, 4, 7, 8 and 13 - 18 on 50 - 100 qubits, the
+    circular ones pay for SWAPs across the chain and circuits 5 and 6 quickly reach
+    max_bond.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        samples: Number of random parameter vectors.
+        batch_size: Number of parameter vectors simulated together.
+        max_bond: Largest bond dimension kept.
+        cutoff: Relative singular value cutoff of the truncation.
+        seed: Seed of the random parameters.
+        distribution: Distribution of the parameters, see
+                      ansatz_metrics.random_parameters.
+
+    Returns:
+        result: "entangling_capability", "variance", "values" and
+                "truncation_error", the largest discarded weight of any sample.
+    """
+
+    rng = np.random.default_rng(seed)
+    gates, num_qubits, num_parameters = compile_ansatz(
+        Ansatz(repitition, feature_dim, circuit_id)
+    )
+    values = np.empty(samples)
+    truncation_error = 0.0
+    for start in range(0, samples, batch_size):
+        size = min(batch_size, samples - start)
+        mps = simulate_mps(
+            gates,
+            num_qubits,
+            random_parameters(rng, (size, num_parameters), distribution),
+            max_bond,
+            cutoff,
+        )
+        purities = mps.reduced_purities()
+        values[start : start + size] = 2 * (1 - np.mean(purities, axis=1))
+        truncation_error = max(truncation_error, float(np.max(mps.truncation_error)))
+    return {
+        "entangling_capability": float(np.mean(values)),
+        "variance": float(np.var(values)),
+        "values": values,
+        "truncation_error": truncation_error,
+    }
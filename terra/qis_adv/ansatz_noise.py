@@ -0,0 +1,446 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Noisy simulation, expressibility and entangling capability of the Ansatz circuits"""
+
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+
+from ansatz_metrics import (
+    _bootstrap_std,
+    fidelity_histogram,
+    haar_fidelity_probabilities,
+    kl_divergence,
+    random_parameters,
+)
+from ansatz_simulator import (
+    _BATCH_AMPLITUDES,
+    Gate,
+    _apply_1q,
+    _apply_gate,
+    compile_ansatz,
+)
+from parametric_circuits import Ansatz
+
+METHODS = ("density_matrix", "trajectories")
+
+
+def _block(rho: np.ndarray, ket: int, bra: int, row: int, col: int) -> np.ndarray:
+    """View of the (row, col) block of a qubit with the given ket and bra axes."""
+    index = [slice(None)] * (max(ket, bra) + 1)
+    index[ket], index[bra] = row, col
+    return rho[tuple(index)]
+
+
+def _apply_noise_dm(
+    rho: np.ndarray, ket: int, bra: int, depolarizing: float, amplitude_damping: float
+) -> None:
+    """Applies the noise channels of one qubit in place to a batch of density matrices."""
+    r00, r01 = _block(rho, ket, bra, 0, 0), _block(rho, ket, bra, 0, 1)
+    r10, r11 = _block(rho, ket, bra, 1, 0), _block(rho, ket, bra, 1, 1)
+    if depolarizing:
+        # rho -> (1 - p) rho + p Tr_q(rho) I / 2
+        mixed = 0.5 * depolarizing * (r00 + r11)
+        for block in (r00, r01, r10, r11):
+            block *= 1 - depolarizing
+        r00 += mixed
+        r11 += mixed
+    if amplitude_damping:
+        r00 += amplitude_damping * r11
+        r11 *= 1 - amplitude_damping
+        r01 *= np.sqrt(1 - amplitude_damping)
+        r10 *= np.sqrt(1 - amplitude_damping)
+
+
+def simulate_density_matrices(
+    gates: Sequence[Gate],
+    num_qubits: int,
+    values: np.ndarray,
+    depolarizing: float = 0.0,
+    amplitude_damping: float = 0.0,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Exact noisy simulation of a batch of parameter vectors. Every gate is followed by
+    a depolarizing channel of strength depolarizing and an amplitude damping channel
+    of strength amplitude_damping on each qubit it acts on.
+
+    Args:
+        gates: Gate list from compile_circuit or compile_ansatz, or a CompactCircuit.
+        num_qubits: Number of qubits of the circuit.
+        values: Array of shape (samples, num_parameters).
+        depolarizing: Depolarizing probability p, rho -> (1 - p) rho + p I / 2.
+        amplitude_damping: Damping probability gamma of |1> -> |0>.
+        batch_size: Maximum number of samples simulated together, defaults to as many
+                    as fit in about 2**14 matrix entries.
+
+    Returns:
+        density_matrices: Array of shape (samples, 2**num_qubits, 2**num_qubits) in
+                          qiskit's little endian ordering.
+    """
+
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    samples = values.shape[0]
+    gates = list(gates)
+    if batch_size is None:
+        batch_size = max(1, _BATCH_AMPLITUDES // 4**num_qubits)
+    dim = 2**num_qubits
+    density_matrices = np.empty((samples, dim, dim), dtype=complex)
+    for start in range(0, samples, batch_size):
+        batch = values[start : start + batch_size]
+        # ket axes 1 ... num_qubits followed by the bra axes
+        rho = np.zeros((len(batch),) + (2,) * (2 * num_qubits), dtype=complex)
+        rho[(slice(None),) + (0,) * (2 * num_qubits)] = 1
+        theta = batch.T.reshape((-1, len(batch)) + (1,) * (2 * num_qubits - 1))
+        for name, qubits, index in gates:
+            angle = theta[index] if index >= 0 else None
+            kets = [num_qubits - qubit for qubit in qubits]
+            bras = [2 * num_qubits - qubit for qubit in qubits]
+            _apply_gate(rho, name, kets, angle)
+            _apply_gate(rho, name, bras, angle, conjugate=True)
+            for ket, bra in zip(kets, bras):
+                _apply_noise_dm(rho, ket, bra, depolarizing, amplitude_damping)
+        density_matrices[start : start + len(batch)] = rho.reshape(len(batch), dim, dim)
+    return density_matrices
+
+
+# entries of I, X, Y and Z, the global phase of Y is dropped as it does not matter
+# for a single trajectory
+_PAULI_ENTRIES = np.array([[1, 0, 0, 1], [0, 1, 1, 0], [0, -1, 1, 0], [1, 0, 0, -1]])
+
+
+def _apply_noise_trajectories(
+    state: np.ndarray,
+    axis: int,
+    depolarizing: float,
+    amplitude_damping: float,
+    rng: np.random.Generator,
+) -> None:
+    """Applies randomly drawn Kraus operators of the noise channels in place."""
+    shape = (len(state),) + (1,) * (state.ndim - 2)
+    if depolarizing:
+        # (1 - p) rho + p I / 2 = (1 - 3p / 4) rho + p / 4 (X rho X + Y rho Y + Z rho Z)
+        pauli = rng.choice(
+            4, size=len(state), p=[1 - 0.75 * depolarizing] + [0.25 * depolarizing] * 3
+        )
+        entries = _PAULI_ENTRIES[pauli].T.reshape((4,) + shape)
+        _apply_1q(state, axis, tuple(entries))
+    if amplitude_damping:
+        amp_1 = state[(slice(None),) * axis + (1,)]
+        weight = np.sum(np.abs(amp_1.reshape(len(state), -1)) ** 2, axis=1)
+        jump = (rng.random(len(state)) < amplitude_damping * weight).reshape(shape)
+        # K1 = sqrt(gamma) |0><1| on a jump and K0 = diag(1, sqrt(1 - gamma)) otherwise
+        keep = np.sqrt(1 - amplitude_damping)
+        _apply_1q(
+            state,
+            axis,
+            (np.where(jump, 0, 1), np.where(jump, 1, 0), 0, np.where(jump, 0, keep)),
+        )
+        norms = np.linalg.norm(state.reshape(len(state), -1), axis=1)
+        state /= norms.reshape(shape + (1,))
+
+
+def simulate_trajectories(
+    gates: Sequence[Gate],
+    num_qubits: int,
+    values: np.ndarray,
+    trajectories: int = 100,
+    depolarizing: float = 0.0,
+    amplitude_damping: float = 0.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Monte Carlo trajectory simulation with the noise of simulate_density_matrices.
+    The average of |psi><psi| over the trajectories of a sample converges to its
+    density matrix, at 2**num_qubits instead of 4**num_qubits amplitudes each.
+
+    Args:
+        gates: Gate list from compile_circuit or compile_ansatz, or a CompactCircuit.
+        num_qubits: Number of qubits of the circuit.
+        values: Array of shape (samples, num_parameters).
+        trajectories: Number of trajectories per sample.
+        depolarizing: Depolarizing probability p.
+        amplitude_damping: Damping probability gamma.
+        rng: Random generator of the Kraus operator draws.
+
+    Returns:
+        statevectors: Array of shape (samples, trajectories, 2**num_qubits).
+    """
+
+    rng = np.random.default_rng() if rng is None else rng
+    values = np.repeat(np.atleast_2d(np.asarray(values, dtype=float)), trajectories, 0)
+    rows = len(values)
+    state = np.zeros((rows,) + (2,) * num_qubits, dtype=complex)
+    state[(slice(None),) + (0,) * num_qubits] = 1
+    theta = values.T.reshape((-1, rows) + (1,) * (num_qubits - 1))
+    for name, qubits, index in gates:
+        axes = [num_qubits - qubit for qubit in qubits]
+        _apply_gate(state, name, axes, theta[index] if index >= 0 else None)
+        for axis in axes:
+            _apply_noise_trajectories(state, axis, depolarizing, amplitude_damping, rng)
+    return state.reshape(-1, trajectories, 2**num_qubits)
+
+
+def reduced_density_matrices(
+    states: np.ndarray, num_qubits: int, method: str = "density_matrix"
+) -> np.ndarray:
+    """
+    Args:
+        states: Density matrices of shape (samples, 2**n, 2**n) or trajectories of
+                shape (samples, trajectories, 2**n).
+        num_qubits: Number of qubits n.
+        method: "density_matrix" or "trajectories", the kind of states.
+
+    Returns:
+        rhos: Array of shape (samples, num_qubits, 2, 2), the reduced state of every
+              qubit, averaged over the trajectories.
+    """
+
+    samples = states.shape[0]
+    rhos = np.empty((samples, num_qubits, 2, 2), dtype=complex)
+    for qubit in range(num_qubits):
+        axis = num_qubits - qubit
+        if method == "trajectories":
+            kets = states.reshape((samples, -1) + (2,) * num_qubits)
+            kets = np.moveaxis(kets, axis + 1, 2).reshape(samples, kets.shape[1], 2, -1)
+            rhos[:, qubit] = (
+                np.einsum("smar,smbr->sab", kets, kets.conj()) / kets.shape[1]
+            )
+        else:
+            rho = states.reshape((samples,) + (2,) * (2 * num_qubits))
+            rho = np.moveaxis(rho, (axis, num_qubits + axis), (1, num_qubits + 1))
+            rho = rho.reshape(samples, 2, 2 ** (num_qubits - 1), 2, -1)
+            rhos[:, qubit] = np.einsum("sarbr->sab", rho)
+    return rhos
+
+
+def _noisy_states(
+    method: str,
+    gates: Sequence[Gate],
+    num_qubits: int,
+    values: np.ndarray,
+    noise: Dict[str, float],
+    trajectories: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    if method == "density_matrix":
+        return simulate_density_matrices(gates, num_qubits, values, **noise)
+    if method == "trajectories":
+        return simulate_trajectories(
+            gates, num_qubits, values, trajectories, rng=rng, **noise
+        )
+    raise ValueError(f"Unknown method {method}, available methods are {METHODS}")
+
+
+def noisy_expressibility(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    depolarizing: float = 0.0,
+    amplitude_damping: float = 0.0,
+    method: str = "density_matrix",
+    samples: int = 2000,
+    bins: int = 75,
+    batch_size: int = 100,
+    trajectories: int = 100,
+    seed: Optional[int] = None,
+    resamples: int = 200,
+    distribution: str = "uniform",
+) -> Dict[str, float]:
+    """
+    Expressibility of a noisy ansatz, the KL divergence from the Haar distribution of
+    the overlaps Tr(rho sigma) of states of random parameter pairs. For pure states
+    this is the fidelity used by ansatz_metrics.expressibility.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        depolarizing: Depolarizing probability after every gate.
+        amplitude_damping: Damping probability after every gate.
+        method: "density_matrix" for exact states or "trajectories", whose overlap
+                estimate pairs the trajectories of the two states and adds sampling
+                noise to the histogram.
+        samples: Number of parameter pairs.
+        bins: Number of fidelity histogram bins.
+        batch_size: Number of pairs simulated together.
+        trajectories: Number of trajectories per state with method "trajectories".
+        seed: Seed of the random parameters and trajectories.
+        resamples: Number of bootstrap resamples of the error estimate.
+        distribution: Distribution of the parameters, see
+                      ansatz_metrics.random_parameters.
+
+    Returns:
+        result: "expressibility", "std_error" and "samples".
+    """
+
+    rng = np.random.default_rng(seed)
+    gates, num_qubits, num_parameters = compile_ansatz(
+        Ansatz(repitition, feature_dim, circuit_id)
+    )
+    noise = {"depolarizing": depolarizing, "amplitude_damping": amplitude_damping}
+    counts = np.zeros(bins, dtype=np.int64)
+    for start in range(0, samples, batch_size):
+        size = min(batch_size, samples - start)
+        values = random_parameters(rng, (2 * size, num_parameters), distribution)
+        states = _noisy_states(
+            method, gates, num_qubits, values, noise, trajectories, rng
+        )
+        first, second = states[:size], states[size:]
+        if method == "density_matrix":
+            overlaps = np.einsum("sij,sij->s", first, second.conj()).real
+        else:
+            overlaps = np.mean(
+                np.abs(np.einsum("smi,smi->sm", first.conj(), second)) ** 2, axis=1
+            )
+        counts += fidelity_histogram(np.clip(overlaps, 0, 1), bins)
+
+    haar = haar_fidelity_probabilities(feature_dim, bins)
+    return {
+        "expressibility": kl_divergence(counts, haar),
+        "std_error": _bootstrap_std(counts, haar, resamples, rng),
+        "samples": int(np.sum(counts)),
+    }
+
+
+def noisy_entangling_capability(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    depolarizing: float = 0.0,
+    amplitude_damping: float = 0.0,
+    method: str = "density_matrix",
+    samples: int = 1000,
+    batch_size: int = 100,
+    trajectories: int = 100,
+    seed: Optional[int] = None,
+    distribution: str = "uniform",
+) -> Dict[str, Any]:
+    """
+    Meyer-Wallach measure 2 (1 - 1/n sum_k Tr(rho_k^2)) of a noisy ansatz, averaged
+    over random parameters. For mixed states it also counts the mixedness the noise
+    adds to the reduced states, not only entanglement.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        depolarizing: Depolarizing probability after every gate.
+        amplitude_damping: Damping probability after every gate.
+        method: "density_matrix" or "trajectories", the reduced states of the
+                trajectories of a sample are averaged before taking the purity.
+        samples: Number of random parameter vectors.
+        batch_size: Number of parameter vectors simulated together.
+        trajectories: Number of trajectories per sample with method "trajectories".
+        seed: Seed of the random parameters and trajectories.
+        distribution: Distribution of the parameters, see
+                      ansatz_metrics.random_parameters.
+
+    Returns:
+        result: "entangling_capability", "variance" and "values".
+    """
+
+    rng = np.random.default_rng(seed)
+    gates, num_qubits, num_parameters = compile_ansatz(
+        Ansatz(repitition, feature_dim, circuit_id)
+    )
+    noise = {"depolarizing": depolarizing, "amplitude_damping": amplitude_damping}
+    values = np.empty(samples)
+    for start in range(0, samples, batch_size):
+        size = min(batch_size, samples - start)
+        states = _noisy_states(
+            method,
+            gates,
+            num_qubits,
+            random_parameters(rng, (size, num_parameters), distribution),
+            noise,
+            trajectories,
+            rng,
+        )
+        rhos = reduced_density_matrices(states, num_qubits, method)
+        purities = np.sum(np.abs(rhos) ** 2, axis=(2, 3))
+        values[start : start + size] = 2 * (1 - np.mean(purities, axis=1))
+    return {
+        "entangling_capability": float(np.mean(values)),
+        "variance": float(np.var(values)),
+        "values": values,
+    }
+
+
+def noise_sweep(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    levels: Sequence[float],
+    channel: str = "depolarizing",
+    seed: Optional[int] = 0,
+    **options: Any,
+) -> Dict[str, np.ndarray]:
+    """
+    Expressibility and entangling capability over a range of noise levels. Every
+    level uses the same seed, so the levels share their random parameters and the
+    curves are not blurred by sampling noise between levels.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        levels: Noise strengths of the sweep.
+        channel: "depolarizing" or "amplitude_damping".
+        seed: Seed shared by all levels.
+        options: method, samples, batch_size, trajectories and distribution of the
+                 noisy metrics.
+
+    Returns:
+        results: Arrays "noise_level", "expressibility", "expressibility_std_error"
+                 and "entangling_capability", one entry per level.
+    """
+
+    if channel not in ("depolarizing", "amplitude_damping"):
+        raise ValueError(
+            f"Unknown channel {channel}, use depolarizing or amplitude_damping"
+        )
+    expr_options = dict(options)
+    # bins and resamples only concern the expressibility
+    ent_options = {
+        key: value for key, value in options.items() if key not in ("bins", "resamples")
+    }
+    results = {
+        "noise_level": np.asarray(levels, dtype=float),
+        "expressibility": np.empty(len(levels)),
+        "expressibility_std_error": np.empty(len(levels)),
+        "entangling_capability": np.empty(len(levels)),
+    }
+    for i, level in enumerate(levels):
+        expr = noisy_expressibility(
+            circuit_id,
+            feature_dim,
+            repitition,
+            seed=seed,
+            **{channel: level},
+            **expr_options,
+        )
+        ent = noisy_entangling_capability(
+            circuit_id,
+            feature_dim,
+            repitition,
+            seed=seed,
+            **{channel: level},
+            **ent_options,
+        )
+        results["expressibility"][i] = expr["expressibility"]
+        results["expressibility_std_error"][i] = expr["std_error"]
+        results["entangling_capability"][i] = ent["entangling_capability"]
+    return results
@@ -0,0 +1,281 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Resource metrics of the Ansatz circuits without building them"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from parametric_circuits import ANSATZ_REGISTRY, Ansatz
+
+# (gate name, qubits), the parameters do not matter for resource counts
+Op = Tuple[str, Tuple[int, ...]]
+
+# barriers add no depth but line up the qubits they span, like in QuantumCircuit.depth()
+BARRIER = "barrier"
+
+# number of CNOTs of each two qubit gate in a CNOT + single qubit decomposition
+CNOT_COST = {"cx": 1, "cz": 1, "crx": 2, "crz": 2}
+
+
+def _rotations(feature_dim: int, *names: str) -> List[Op]:
+    """The rotations names applied one qubit after the other."""
+    return [(name, (i,)) for i in range(feature_dim) for name in names]
+
+
+def _pairs(name: str, pairs) -> List[Op]:
+    return [(name, pair) for pair in pairs]
+
+
+def ansatz_structure(circuit_id: int, feature_dim: int) -> Tuple[List[Op], List[Op]]:
+    """
+    Structural description of get_circ_<circuit_id>, the gates of one repitition in
+    the order the builder adds them. Its size does not depend on the repititions.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+
+    Returns:
+        prefix: Gates added once before the first repitition.
+        layer: Gates added by every repitition, including the barriers.
+
+    Raises:
+        ValueError: If circuit_id is not one of the available circuits.
+    """
+
+    n = feature_dim
+    ladder = [(i + 1, i) for i in reversed(range(n - 1))]
+    even = [(i + 1, i) for i in range(0, n - 1, 2)]
+    odd = [(i + 1, i) for i in range(1, n - 1, 2)]
+    ring = [(n - 1, 0)] + [(i, i + 1) for i in range(n - 1)]
+    reversed_ring = [(n - 1, n - 2), (0, n - 1)] + [(i + 1, i) for i in range(n - 2)]
+    controlled = {3: "crz", 4: "crx", 5: "crz", 6: "crx", 7: "crz", 8: "crx"}
+    controlled.update({11: "cx", 12: "cz", 13: "crz", 14: "crx", 15: "cx"})
+    controlled.update({16: "crz", 17: "crx", 18: "crz", 19: "crx"})
+    barrier = [(BARRIER, tuple(range(n)))]
+
+    if circuit_id == 1:
+        return [], _rotations(n, "rx", "rz") + barrier
+    if circuit_id == 2:
+        return [], _rotations(n, "rx", "rz") + _pairs("cx", ladder) + barrier
+    if circuit_id in (3, 4):
+        gate = controlled[circuit_id]
+        return [], _rotations(n, "rx", "rz") + _pairs(gate, ladder) + barrier
+    if circuit_id in (5, 6):
+        # the NLocal rotation layer follows every entangling block
+        all_to_all = [
+            (block, i)
+            for block in reversed(range(n))
+            for i in reversed(range(n))
+            if i != block
+        ]
+        return _rotations(n, "rx", "rz"), (
+            _pairs(controlled[circuit_id], all_to_all) + _rotations(n, "rx", "rz")
+        )
+    if circuit_id in (7, 8, 16, 17):
+        gate = controlled[circuit_id]
+        if circuit_id in (7, 8):
+            middle, end = barrier + _rotations(n, "rx", "rz"), []
+        else:
+            middle, end = barrier, barrier
+        return [], (
+            _rotations(n, "rx", "rz")
+            + _pairs(gate, even)
+            + middle
+            + _pairs(gate, odd)
+            + end
+        )
+    if circuit_id == 9:
+        return [], (_rotations(n, "h") + _pairs("cz", ladder) + _rotations(n, "rx"))
+    if circuit_id == 10:
+        chain = [(i, i + 1) for i in range(n - 1)]
+        return _rotations(n, "ry"), (
+            _rotations(n, "h") + _pairs("cz", chain) + _rotations(n, "rx")
+        )
+    if circuit_id in (11, 12):
+        gate = controlled[circuit_id]
+        inner = [
+            op
+            for i in range(1, n - 1, 2)
+            for op in (("ry", (i,)), ("rz", (i,)), ("ry", (i + 1,)), ("rz", (i + 1,)))
+        ]
+        return [], (
+            _rotations(n, "rx", "rz")
+            + _pairs(gate, even)
+            + barrier
+            + inner
+            + _pairs(gate, odd)
+            + (barrier if circuit_id == 12 else [])
+        )
+    if circuit_id in (13, 14, 15):
+        gate = controlled[circuit_id]
+        return [], (
+            _rotations(n, "ry")
+            + _pairs(gate, ring)
+            + _rotations(n, "ry")
+            + _pairs(gate, reversed_ring)
+            + barrier
+        )
+    if circuit_id in (18, 19):
+        gate = controlled[circuit_id]
+        return [], _rotations(n, "rx", "rz") + _pairs(gate, ring) + barrier
+    raise ValueError(
+        f"Unknown circuit_id {circuit_id}, available circuit ids are "
+        f"{sorted(ANSATZ_REGISTRY)}"
+    )
+
+
+def expand_structure(circuit_id: int, feature_dim: int, repitition: int) -> List[Op]:
+    """
+    Returns:
+        ops: Every gate and barrier of the circuit in order, e.g. to check the
+             structural description against the built circuit.
+    """
+
+    prefix, layer = ansatz_structure(circuit_id, feature_dim)
+    return prefix + layer * repitition
+
+
+def _advance(levels: List[int], ops: List[Op]) -> None:
+    """As soon as possible scheduling of ops, levels holds the depth of every qubit."""
+    for name, qubits in ops:
+        level = max(levels[qubit] for qubit in qubits) + (name != BARRIER)
+        for qubit in qubits:
+            levels[qubit] = level
+
+
+def structure_depth(
+    prefix: List[Op], layer: List[Op], feature_dim: int, repitition: int
+) -> int:
+    """
+    Args:
+        prefix: Gates applied once.
+        layer: Gates applied repitition times after the prefix.
+        feature_dim: The no. of qubits.
+        repitition: The no of repititions of layer.
+
+    Returns:
+        depth: Circuit depth, the same as QuantumCircuit.depth() which ignores
+               barriers.
+    """
+
+    levels = [0] * feature_dim
+    _advance(levels, prefix)
+    for rep in range(repitition):
+        previous = list(levels)
+        _advance(levels, layer)
+        shift = {level - before for level, before in zip(levels, previous)}
+        if len(shift) == 1:
+            # once a repitition shifts every qubit by the same amount the schedule is
+            # periodic and every further repitition adds the same shift
+            return max(levels) + shift.pop() * (repitition - rep - 1)
+    return max(levels, default=0)
+
+
+def resource_metrics(
+    circuit_id: int, feature_dim: int, repitition: int
+) -> Dict[str, object]:
+    """
+    Gate counts, CNOT count, parameter count and depth of an ansatz, derived from its
+    structural description so no QuantumCircuit is built. Counts only scale the gates
+    of a single repitition and the depth schedule stops as soon as it turns periodic,
+    so large feature_dim and repitition stay cheap.
+
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+
+    Returns:
+        metrics: "gate_counts" (gate name -> count, like count_ops() without
+                 barriers), "num_gates", "num_single_qubit_gates",
+                 "num_two_qubit_gates", "cnot_count" (CNOTs after decomposing every
+                 two qubit gate with CNOT_COST), "num_parametric_gates",
+                 "num_parameters" and "depth".
+    """
+
+    prefix, layer = ansatz_structure(circuit_id, feature_dim)
+    counts = Counter(name for name, _ in prefix)
+    for name, count in Counter(name for name, _ in layer).items():
+        counts[name] += count * repitition
+    counts.pop(BARRIER, None)
+
+    two_qubit = sum(counts[name] for name in CNOT_COST)
+    return {
+        "gate_counts": dict(counts),
+        "num_gates": sum(counts.values()),
+        "num_single_qubit_gates": sum(counts.values()) - two_qubit,
+        "num_two_qubit_gates": two_qubit,
+        "cnot_count": sum(counts[name] * cost for name, cost in CNOT_COST.items()),
+        "num_parametric_gates": sum(
+            counts[name] for name in ("rx", "ry", "rz", "crx", "crz")
+        ),
+        "num_parameters": Ansatz(repitition, feature_dim, circuit_id).num_parameters(),
+        "depth": structure_depth(prefix, layer, feature_dim, repitition),
+    }
+
+
+def check_resource_metrics(
+    circuit_ids: Iterable[int] = tuple(ANSATZ_REGISTRY),
+    feature_dims: Iterable[int] = range(2, 8),
+    repititions: Iterable[int] = range(1, 5),
+) -> List[str]:
+    """
+    Compares the gate counts, two qubit gate count and depth of resource_metrics with
+    count_ops() and depth() of the circuits Ansatz.get_ansatz() actually builds. Run
+    it after changing an ansatz, the structures above have to follow.
+
+    Args:
+        circuit_ids: Circuit ids to check, all by default.
+        feature_dims: Numbers of qubits to check.
+        repititions: Repititions to check.
+
+    Returns:
+        mismatches: One message per differing metric, empty when all agree.
+    """
+
+    mismatches = []
+    for circuit_id in circuit_ids:
+        for feature_dim in feature_dims:
+            for repitition in repititions:
+                ansatz = Ansatz(repitition, feature_dim, circuit_id)
+                circuit = ansatz.get_ansatz()
+                counts = dict(circuit.count_ops())
+                counts.pop(BARRIER, None)
+                built = {
+                    "gate_counts": counts,
+                    "num_two_qubit_gates": sum(
+                        1
+                        for instruction in circuit.data
+                        if len(instruction.qubits) == 2
+                        and instruction.operation.name != BARRIER
+                    ),
+                    "depth": circuit.depth(),
+                }
+                metrics = resource_metrics(circuit_id, feature_dim, repitition)
+                for name, value in built.items():
+                    if metrics[name] != value:
+                        mismatches.append(
+                            f"circuit {circuit_id}, {feature_dim} qubits, repitition "
+                            f"{repitition}: {name} is {metrics[name]}, the circuit "
+                            f"has {value}"
+                        )
+    return mismatches
+
+
+if __name__ == "__main__":
+    errors = check_resource_metrics()
+    print("\n".join(errors) or "resource_metrics agrees with parametric_circuits")
+    raise SystemExit(1 if errors else 0)
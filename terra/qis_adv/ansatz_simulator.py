@@ -0,0 +1,388 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Batched statevector simulator for the Ansatz gate set"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+# (gate name, qubits, index into the parameter vector or -1 for fixed gates)
+Gate = Tuple[str, Tuple[int, ...], int]
+
+PARAMETRIC_GATES = ("rx", "ry", "rz", "crx", "crz")
+FIXED_GATES = ("h", "cx", "cz")
+SUPPORTED_GATES = PARAMETRIC_GATES + FIXED_GATES
+
+# default number of amplitudes simulated together, small batches stay in cache
+_BATCH_AMPLITUDES = 2**14
+
+
+def compile_circuit(circuit: Any) -> List[Gate]:
+    """
+    Args:
+        circuit: QuantumCircuit made of the Ansatz gate set whose rotation angles are
+                 elements of a single ParameterVector, e.g. from Ansatz.get_template().
+
+    Returns:
+        gates: The gate list of the circuit, barriers are dropped.
+
+    Raises:
+        ValueError: If the circuit holds a gate outside the Ansatz gate set or an angle
+                    that is not a ParameterVector element.
+    """
+
+    gates = []
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name == "barrier":
+            continue
+        if operation.name not in SUPPORTED_GATES:
+            raise ValueError(
+                f"Gate {operation.name} is not part of the Ansatz gate set"
+            )
+        qubits = tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits)
+        index = -1
+        if operation.name in PARAMETRIC_GATES:
+            param = operation.params[0]
+            if not hasattr(param, "index"):
+                raise ValueError(
+                    f"Angle {param} of {operation.name} is not a ParameterVector element"
+                )
+            index = param.index
+        gates.append((operation.name, qubits, index))
+    return gates
+
+
+def compile_ansatz(ansatz: Any) -> Tuple[List[Gate], int, int]:
+    """
+    Args:
+        ansatz: Ansatz instance.
+
+    Returns:
+        gates: Gate list of the cached parameterized template of the ansatz.
+        num_qubits: Number of qubits of the ansatz.
+        num_parameters: Length of the parameter vector the gate list indexes into.
+    """
+
+    template, paravec = ansatz.get_template()
+    return compile_circuit(template), template.num_qubits, len(paravec)
+
+
+class CompactCircuit:
+    """
+    Array backed description of a circuit made of the Ansatz gate set: one opcode, a
+    (control, target) qubit pair and a parameter index per gate. It is a few bytes per
+    gate, so it is much cheaper to send to worker processes than a QuantumCircuit, and
+    it iterates as the gate list simulate_statevectors consumes.
+
+    Pickling passes the arrays on as they are. ProcessPoolExecutor and
+    multiprocessing pickle them compactly, in-band, at the default protocol. With
+    pickle protocol 5 and a buffer_callback they go out of band instead, and
+    to_buffers and from_buffers give the same zero-copy buffers for other transports.
+    """
+
+    __slots__ = ("num_qubits", "num_parameters", "opcodes", "qubits", "params")
+
+    def __init__(
+        self,
+        num_qubits: int,
+        num_parameters: int,
+        opcodes: np.ndarray,
+        qubits: np.ndarray,
+        params: np.ndarray,
+    ) -> None:
+        """
+        Args:
+            num_qubits: Number of qubits of the circuit.
+            num_parameters: Length of the parameter vector params indexes into.
+            opcodes: uint8 array, the index of every gate in SUPPORTED_GATES.
+            qubits: int32 array of shape (gates, 2), the qubits of every gate with -1
+                    as the second entry of single qubit gates.
+            params: int32 array, the parameter index of every gate, -1 for fixed gates.
+        """
+        self.num_qubits = num_qubits
+        self.num_parameters = num_parameters
+        self.opcodes = np.asarray(opcodes, dtype=np.uint8)
+        self.qubits = np.asarray(qubits, dtype=np.int32).reshape(-1, 2)
+        self.params = np.asarray(params, dtype=np.int32)
+
+    @classmethod
+    def from_gates(
+        cls, gates: Sequence[Gate], num_qubits: int, num_parameters: int
+    ) -> "CompactCircuit":
+        """
+        Args:
+            gates: Gate list, e.g. from compile_circuit.
+            num_qubits: Number of qubits of the circuit.
+            num_parameters: Length of the parameter vector the gates index into.
+
+        Returns:
+            compact: The gate list as arrays.
+        """
+
+        opcodes = [SUPPORTED_GATES.index(name) for name, _, _ in gates]
+        qubits = [tuple(qubits) + (-1,) * (2 - len(qubits)) for _, qubits, _ in gates]
+        params = [index for _, _, index in gates]
+        return cls(num_qubits, num_parameters, opcodes, qubits, params)
+
+    @classmethod
+    def from_circuit(
+        cls, circuit: Any, num_parameters: Optional[int] = None
+    ) -> "CompactCircuit":
+        """
+        Args:
+            circuit: QuantumCircuit accepted by compile_circuit, barriers are dropped.
+            num_parameters: Length of the parameter vector, defaults to one more than
+                            the largest parameter index used.
+
+        Returns:
+            compact: The circuit as arrays.
+        """
+
+        gates = compile_circuit(circuit)
+        if num_parameters is None:
+            num_parameters = max((index for _, _, index in gates), default=-1) + 1
+        return cls.from_gates(gates, circuit.num_qubits, num_parameters)
+
+    @classmethod
+    def from_ansatz(cls, ansatz: Any) -> "CompactCircuit":
+        """
+        Returns:
+            compact: The cached parameterized template of the Ansatz instance as arrays.
+        """
+
+        return cls.from_gates(*compile_ansatz(ansatz))
+
+    def to_circuit(self, paravec: Optional[Any] = None) -> Any:
+        """
+        Args:
+            paravec: Parameter values of length num_parameters, a ParameterVector of
+                     that length by default.
+
+        Returns:
+            circ: QuantumCircuit with the gates of the description.
+        """
+
+        from qiskit import QuantumCircuit
+        from qiskit.circuit import ParameterVector
+
+        if paravec is None:
+            paravec = ParameterVector("θ", self.num_parameters)
+        circ = QuantumCircuit(self.num_qubits)
+        for name, qubits, index in self:
+            if index >= 0:
+                getattr(circ, name)(paravec[index], *qubits)
+            else:
+                getattr(circ, name)(*qubits)
+        return circ
+
+    def to_buffers(self) -> Tuple[Dict[str, int], List[memoryview]]:
+        """
+        Returns:
+            header: The sizes needed by from_buffers.
+            buffers: Memoryviews of the opcode, qubit and parameter arrays, no data is
+                     copied.
+        """
+
+        header = {
+            "num_qubits": self.num_qubits,
+            "num_parameters": self.num_parameters,
+        }
+        arrays = (self.opcodes, self.qubits, self.params)
+        return header, [memoryview(np.ascontiguousarray(array)) for array in arrays]
+
+    @classmethod
+    def from_buffers(
+        cls, header: Dict[str, int], buffers: Sequence[Any]
+    ) -> "CompactCircuit":
+        """
+        Args:
+            header: Header from to_buffers.
+            buffers: The three buffers from to_buffers, or copies of them received
+                     from another process.
+
+        Returns:
+            compact: Description whose arrays are read-only views of the buffers.
+        """
+
+        opcodes, qubits, params = (
+            np.frombuffer(buffer, dtype=dtype)
+            for buffer, dtype in zip(buffers, (np.uint8, np.int32, np.int32))
+        )
+        return cls(
+            header["num_qubits"], header["num_parameters"], opcodes, qubits, params
+        )
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (
+                self.num_qubits,
+                self.num_parameters,
+                self.opcodes,
+                self.qubits,
+                self.params,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __iter__(self) -> Iterator[Gate]:
+        for opcode, (control, target), index in zip(
+            self.opcodes.tolist(), self.qubits.tolist(), self.params.tolist()
+        ):
+            qubits = (control,) if target < 0 else (control, target)
+            yield SUPPORTED_GATES[opcode], qubits, index
+
+
+def _rotation(
+    name: str, theta: np.ndarray, conjugate: bool = False
+) -> Tuple[Any, Any, Any, Any]:
+    """
+    2 x 2 matrix entries of a (controlled) rotation, one value per sample, or of its
+    complex conjugate.
+    """
+    sign = -1 if conjugate else 1
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    if name in ("rx", "crx"):
+        return cos, -1j * sign * sin, -1j * sign * sin, cos
+    if name == "ry":
+        return cos, -sin, sin, cos
+    return np.exp(-0.5j * sign * theta), None, None, np.exp(0.5j * sign * theta)
+
+
+def _apply_1q(state: np.ndarray, axis: int, matrix: Tuple[Any, Any, Any, Any]) -> None:
+    """
+    Applies a 2 x 2 matrix in place along axis of a (batch, 2, ..., 2) array, the
+    entries broadcast against the amplitudes so they can hold one value per sample.
+    Off diagonal entries of None mark a diagonal matrix.
+    """
+    amp_0 = state[(slice(None),) * axis + (0,)]
+    amp_1 = state[(slice(None),) * axis + (1,)]
+    u00, u01, u10, u11 = matrix
+    if u01 is None:
+        amp_0 *= u00
+        amp_1 *= u11
+        return
+    new_0 = u00 * amp_0 + u01 * amp_1
+    amp_1[...] = u10 * amp_0 + u11 * amp_1
+    amp_0[...] = new_0
+
+
+def _swap(state: np.ndarray, axis: int) -> None:
+    """Applies an X gate in place along axis of a (batch, 2, ..., 2) array."""
+    amp_0 = state[(slice(None),) * axis + (0,)]
+    amp_1 = state[(slice(None),) * axis + (1,)]
+    new_0 = amp_1.copy()
+    amp_1[...] = amp_0
+    amp_0[...] = new_0
+
+
+def _apply_gate(
+    state: np.ndarray,
+    name: str,
+    axes: Sequence[int],
+    angle: Optional[np.ndarray],
+    conjugate: bool = False,
+) -> None:
+    """
+    Applies one gate of the Ansatz gate set in place to a (batch, 2, ..., 2) array.
+    axes are the axes of the gate qubits and angle the per sample angles, broadcast
+    against the amplitudes with one axis removed. conjugate applies the complex
+    conjugate of the gate, as needed on the bra axes of a density matrix.
+    """
+    if name == "h":
+        root = 1 / np.sqrt(2)
+        _apply_1q(state, axes[0], (root, root, root, -root))
+        return
+    if name in ("rx", "ry", "rz"):
+        _apply_1q(state, axes[0], _rotation(name, angle, conjugate))
+        return
+    # restrict to the control = 1 half of the state
+    control, target = axes
+    sub = state[(slice(None),) * control + (1,)]
+    target = target - 1 if target > control else target
+    if name == "cx":
+        _swap(sub, target)
+    elif name == "cz":
+        sub[(slice(None),) * target + (1,)] *= -1
+    else:
+        _apply_1q(sub, target, _rotation(name, angle[..., 0], conjugate))
+
+
+def simulate_statevectors(
+    gates: Sequence[Gate],
+    num_qubits: int,
+    values: np.ndarray,
+    batch_size: Optional[int] = None,
+    dtype: Any = np.complex128,
+) -> np.ndarray:
+    """
+    Simulates the gate list for a whole batch of parameter vectors at once, every gate
+    is applied as one vectorized operation over the (batch, 2, ..., 2) state tensor.
+
+    Args:
+        gates: Gate list from compile_circuit or compile_ansatz, or a CompactCircuit.
+        num_qubits: Number of qubits of the circuit.
+        values: Array of shape (samples, num_parameters), one parameter vector per row.
+        batch_size: Maximum number of samples simulated together, defaults to as many as
+                    fit in about 2**14 amplitudes.
+        dtype: Complex dtype of the simulation.
+
+    Returns:
+        statevectors: Array of shape (samples, 2**num_qubits) in qiskit's little endian
+                      ordering.
+    """
+
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    samples = values.shape[0]
+    gates = list(gates)
+    if batch_size is None:
+        batch_size = max(1, _BATCH_AMPLITUDES // 2**num_qubits)
+    statevectors = np.empty((samples, 2**num_qubits), dtype=dtype)
+    for start in range(0, samples, batch_size):
+        batch = values[start : start + batch_size]
+        state = np.zeros((len(batch),) + (2,) * num_qubits, dtype=dtype)
+        state[(slice(None),) + (0,) * num_qubits] = 1
+        # per sample angles broadcast over the amplitudes of the remaining qubits
+        theta = batch.T.reshape((-1, len(batch)) + (1,) * (num_qubits - 1))
+        for name, qubits, index in gates:
+            # qubit q is axis num_qubits - q, axis 0 holds the batch
+            axes = [num_qubits - qubit for qubit in qubits]
+            _apply_gate(state, name, axes, theta[index] if index >= 0 else None)
+        statevectors[start : start + len(batch)] = state.reshape(len(batch), -1)
+    return statevectors
+
+
+def ansatz_statevectors(
+    ansatz: Any,
+    values: Optional[np.ndarray] = None,
+    samples: int = 1,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Args:
+        ansatz: Ansatz instance.
+        values: Array of shape (samples, ansatz.num_parameters()), drawn with
+                np.random.randn like get_ansatz does when not given.
+        samples: Number of random parameter vectors drawn when values is not given.
+        batch_size: Maximum number of samples simulated together.
+
+    Returns:
+        statevectors: Array of shape (samples, 2**feature_dim).
+    """
+
+    gates, num_qubits, num_parameters = compile_ansatz(ansatz)
+    if values is None:
+        values = np.random.randn(samples, num_parameters)
+    return simulate_statevectors(gates, num_qubits, values, batch_size=batch_size)
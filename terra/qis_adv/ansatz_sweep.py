@@ -0,0 +1,339 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Parallel parameter sweeps over the Ansatz circuits"""
+
+import argparse
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ansatz_metrics import DISTRIBUTIONS, entangling_capability, expressibility
+from ansatz_resources import resource_metrics
+from ansatz_simulator import CompactCircuit
+from parametric_circuits import ANSATZ_REGISTRY, Ansatz
+
+# columns of the results store, in order
+COLUMNS = (
+    "circuit_id",
+    "repitition",
+    "feature_dim",
+    "seed",
+    "expressibility",
+    "expressibility_std_error",
+    "entangling_capability",
+    "entangling_variance",
+    "num_parameters",
+    "num_gates",
+    "num_two_qubit_gates",
+    "depth",
+)
+
+
+def task_seed(seed: int, circuit_id: int, repitition: int, feature_dim: int) -> int:
+    """
+    Returns:
+        seed: Seed of one sweep task, derived from the sweep seed and the task
+              configuration only so it does not depend on the order tasks run in.
+    """
+
+    sequence = np.random.SeedSequence([seed, circuit_id, repitition, feature_dim])
+    return int(sequence.generate_state(1)[0])
+
+
+def sweep_tasks(
+    circuit_ids: Iterable[int],
+    repititions: Iterable[int],
+    feature_dims: Iterable[int],
+    seed: int = 0,
+    **options: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Args:
+        circuit_ids: Circuit ids of the sweep.
+        repititions: Repititions of the sweep.
+        feature_dims: Numbers of qubits of the sweep.
+        seed: Sweep seed, every task gets its own seed from task_seed.
+        options: Keyword arguments passed on to run_task.
+
+    Returns:
+        tasks: One keyword dict for run_task per point of the grid.
+    """
+
+    return [
+        dict(
+            circuit_id=circuit_id,
+            repitition=repitition,
+            feature_dim=feature_dim,
+            seed=task_seed(seed, circuit_id, repitition, feature_dim),
+            **options,
+        )
+        for circuit_id in circuit_ids
+        for repitition in repititions
+        for feature_dim in feature_dims
+    ]
+
+
+def run_task(
+    circuit_id: int,
+    repitition: int,
+    feature_dim: int,
+    seed: int,
+    expressibility_samples: int = 5000,
+    entangling_samples: int = 1000,
+    bins: int = 75,
+    distribution: str = "uniform",
+    circuit: Optional[CompactCircuit] = None,
+) -> Dict[str, Any]:
+    """
+    Args:
+        circuit_id: The id of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        feature_dim: The no. of qubits of the circuit.
+        seed: Seed of the random parameters.
+        expressibility_samples: Number of parameter pairs for the expressibility.
+        entangling_samples: Number of parameter vectors for the entangling capability.
+        bins: Number of fidelity histogram bins.
+        distribution: Distribution of the parameters, see
+                      ansatz_metrics.random_parameters.
+        circuit: CompactCircuit of the ansatz, as run_sweep ships it to the workers.
+                 Both metrics simulate it directly and the gate counts come from
+                 resource_metrics, so the worker builds no QuantumCircuit.
+
+    Returns:
+        row: Value of every column in COLUMNS for this configuration.
+    """
+
+    resources = resource_metrics(circuit_id, feature_dim, repitition)
+    expr = expressibility(
+        circuit_id,
+        feature_dim,
+        repitition,
+        expressibility_samples,
+        bins,
+        seed=seed,
+        distribution=distribution,
+        circuit=circuit,
+    )
+    ent = entangling_capability(
+        circuit_id,
+        feature_dim,
+        repitition,
+        entangling_samples,
+        seed=seed + 1,
+        distribution=distribution,
+        circuit=circuit,
+    )
+    return {
+        "circuit_id": circuit_id,
+        "repitition": repitition,
+        "feature_dim": feature_dim,
+        "seed": seed,
+        "expressibility": expr["expressibility"],
+        "expressibility_std_error": expr["std_error"],
+        "entangling_capability": ent["entangling_capability"],
+        "entangling_variance": ent["variance"],
+        "num_parameters": resources["num_parameters"],
+        "num_gates": resources["num_gates"],
+        "num_two_qubit_gates": resources["num_two_qubit_gates"],
+        "depth": resources["depth"],
+    }
+
+
+def checkpoint_header(seed: int, **options: Any) -> Dict[str, Any]:
+    """
+    Returns:
+        header: The sweep seed and every run_task option, defaults included, that the
+                rows of a checkpoint were computed with.
+    """
+
+    defaults = {
+        name: parameter.default
+        for name, parameter in inspect.signature(run_task).parameters.items()
+        if parameter.default is not inspect.Parameter.empty and name != "circuit"
+    }
+    unknown = set(options) - set(defaults)
+    if unknown:
+        raise TypeError(f"Unknown run_task options {sorted(unknown)}")
+    return {"seed": seed, **defaults, **options}
+
+
+def _run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    return run_task(**task)
+
+
+def _task_key(row: Dict[str, Any]) -> tuple:
+    return row["circuit_id"], row["repitition"], row["feature_dim"]
+
+
+def results_path(path: str) -> str:
+    """
+    Returns:
+        path: Path of the results store, .npz is appended to paths that end neither in
+              .parquet nor in .npz, as np.savez does.
+    """
+
+    if path.endswith((".parquet", ".npz")):
+        return path
+    return path + ".npz"
+
+
+def save_results(rows: List[Dict[str, Any]], path: str) -> str:
+    """
+    Writes rows as a columnar store, a Parquet file (needs pandas with pyarrow) when
+    path ends in .parquet and a NumPy .npz archive with one array per column otherwise.
+
+    Returns:
+        path: The path written, see results_path.
+    """
+
+    path = results_path(path)
+    rows = sorted(rows, key=_task_key)
+    columns = {name: np.array([row[name] for row in rows]) for name in COLUMNS}
+    if path.endswith(".parquet"):
+        import pandas as pd
+
+        pd.DataFrame(columns).to_parquet(path)
+    else:
+        np.savez(path, **columns)
+    return path
+
+
+def load_results(path: str) -> Dict[str, np.ndarray]:
+    """
+    Returns:
+        columns: One array per column of a store written by save_results.
+    """
+
+    path = results_path(path)
+    if path.endswith(".parquet"):
+        import pandas as pd
+
+        frame = pd.read_parquet(path)
+        return {name: frame[name].to_numpy() for name in frame.columns}
+    with np.load(path) as data:
+        return dict(data)
+
+
+def run_sweep(
+    output: str,
+    circuit_ids: Iterable[int] = tuple(ANSATZ_REGISTRY),
+    repititions: Iterable[int] = (1, 2, 3, 4, 5),
+    feature_dims: Iterable[int] = (4,),
+    seed: int = 0,
+    processes: Optional[int] = None,
+    checkpoint: Optional[str] = None,
+    **options: Any,
+) -> Dict[str, np.ndarray]:
+    """
+    Runs every (circuit_id, repitition, feature_dim) configuration on a process pool
+    and stores the results in a columnar store.
+
+    Every finished task is appended to the checkpoint file right away. Running the
+    same sweep again skips the tasks found there, so an interrupted sweep resumes
+    where it stopped and gives the same numbers as an uninterrupted one. The first line
+    of the checkpoint holds checkpoint_header, a checkpoint written with another seed
+    or other options is refused rather than mixed into the results. Rows of the
+    checkpoint outside the requested grid stay in it but are not returned or stored.
+
+    Args:
+        output: Path of the results store, .parquet or .npz.
+        circuit_ids: Circuit ids of the sweep, all 19 by default.
+        repititions: Repititions of the sweep.
+        feature_dims: Numbers of qubits of the sweep.
+        seed: Sweep seed.
+        processes: Number of worker processes, defaults to the number of CPUs.
+        checkpoint: Path of the checkpoint file, defaults to output + ".jsonl".
+        options: expressibility_samples, entangling_samples, bins and distribution of
+                 run_task.
+
+    Returns:
+        columns: One array per column of COLUMNS, sorted by configuration.
+    """
+
+    checkpoint = output + ".jsonl" if checkpoint is None else checkpoint
+    header = checkpoint_header(seed, **options)
+    lines = []
+    if os.path.exists(checkpoint):
+        with open(checkpoint) as file:
+            lines = [json.loads(line) for line in file if line.strip()]
+    if not lines:
+        with open(checkpoint, "w") as file:
+            file.write(json.dumps({"header": header}) + "\n")
+    elif lines[0].get("header") != header:
+        raise ValueError(
+            f"Checkpoint {checkpoint} was written with {lines[0].get('header')}, "
+            f"not {header}. Remove it or pass another checkpoint path."
+        )
+    tasks = sweep_tasks(circuit_ids, repititions, feature_dims, seed, **options)
+    grid = {_task_key(task) for task in tasks}
+    rows = [row for row in lines[1:] if _task_key(row) in grid]
+    done = {_task_key(row) for row in rows}
+    tasks = [task for task in tasks if _task_key(task) not in done]
+    for task in tasks:
+        # compiled once here and pickled compactly, in-band, with the task, the
+        # workers simulate it without building the QuantumCircuit template again
+        task["circuit"] = CompactCircuit.from_ansatz(
+            Ansatz(task["repitition"], task["feature_dim"], task["circuit_id"])
+        )
+
+    if tasks:
+        with ProcessPoolExecutor(max_workers=processes) as executor, open(
+            checkpoint, "a"
+        ) as file:
+            futures = [executor.submit(_run_task, task) for task in tasks]
+            for future in as_completed(futures):
+                row = future.result()
+                file.write(json.dumps(row) + "\n")
+                file.flush()
+                rows.append(row)
+
+    return load_results(save_results(rows, output))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Sweep the Ansatz circuits.")
+    parser.add_argument("output", help="results store, .parquet or .npz")
+    parser.add_argument(
+        "--circuit-ids", type=int, nargs="+", default=list(ANSATZ_REGISTRY)
+    )
+    parser.add_argument("--repititions", type=int, nargs="+", default=[1, 2, 3, 4, 5])
+    parser.add_argument("--feature-dims", type=int, nargs="+", default=[4])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--expressibility-samples", type=int, default=5000)
+    parser.add_argument("--entangling-samples", type=int, default=1000)
+    parser.add_argument("--bins", type=int, default=75)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    args = parser.parse_args(argv)
+
+    run_sweep(
+        args.output,
+        args.circuit_ids,
+        args.repititions,
+        args.feature_dims,
+        seed=args.seed,
+        processes=args.processes,
+        expressibility_samples=args.expressibility_samples,
+        entangling_samples=args.entangling_samples,
+        bins=args.bins,
+        distribution=args.distribution,
+    )
+
+
+if __name__ == "__main__":
+    main()
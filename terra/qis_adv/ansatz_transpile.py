@@ -0,0 +1,204 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Transpile the Ansatz templates once per target and bind many parameter sets"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from parametric_circuits import Ansatz
+
+# (circuit_id, repitition, feature_dim, target key) -> transpiled template
+_TRANSPILED_CACHE: Dict[Tuple[int, int, int, str], Any] = {}
+
+
+def _edges(coupling_map: Any) -> Optional[List[List[int]]]:
+    """Sorted qubit pairs of a CouplingMap or a list of pairs, None for all-to-all."""
+    if coupling_map is None:
+        return None
+    if hasattr(coupling_map, "get_edges"):
+        coupling_map = coupling_map.get_edges()
+    return sorted(map(list, coupling_map))
+
+
+def _backend_description(backend: Any) -> Dict[str, Any]:
+    """
+    Name, version, coupling map and basis gates of a BackendV1 or BackendV2, the parts
+    of the backend the transpiled circuit depends on.
+    """
+    if getattr(backend, "version", 1) >= 2:
+        return {
+            "name": backend.name,
+            "backend_version": getattr(backend, "backend_version", None),
+            "coupling_map": _edges(backend.coupling_map),
+            "basis_gates": sorted(backend.operation_names),
+        }
+    config = backend.configuration()
+    return {
+        "name": config.backend_name,
+        "backend_version": getattr(config, "backend_version", None),
+        "coupling_map": _edges(config.coupling_map),
+        "basis_gates": sorted(config.basis_gates),
+    }
+
+
+def target_key(
+    backend: Optional[Any] = None,
+    coupling_map: Optional[Sequence[Sequence[int]]] = None,
+    basis_gates: Optional[Sequence[str]] = None,
+    optimization_level: int = 1,
+    seed_transpiler: int = 0,
+) -> str:
+    """
+    Returns:
+        key: Short stable hash of the transpilation target and options, used in the
+             cache file names. A backend is hashed by its name, version, coupling map
+             and basis gates, so backends sharing a name do not share entries.
+    """
+
+    description = {
+        "backend": None if backend is None else _backend_description(backend),
+        "coupling_map": _edges(coupling_map),
+        "basis_gates": sorted(basis_gates) if basis_gates else None,
+        "optimization_level": optimization_level,
+        "seed_transpiler": seed_transpiler,
+    }
+    text = json.dumps(description, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def transpile_template(
+    ansatz: Any,
+    backend: Optional[Any] = None,
+    coupling_map: Optional[Sequence[Sequence[int]]] = None,
+    basis_gates: Optional[Sequence[str]] = None,
+    optimization_level: int = 1,
+    seed_transpiler: int = 0,
+    cache_dir: Optional[str] = None,
+) -> Any:
+    """
+    Transpiles the parameterized template of an ansatz once per target. The result
+    is cached in memory and, with cache_dir, as a QPY file so later processes skip the
+    transpilation too.
+
+    Args:
+        ansatz: Ansatz instance.
+        backend: Backend to transpile for, e.g. FakeMelbourne() as in
+                 SamplePassManager.py.
+        coupling_map: Coupling map as a list of qubit pairs, used without a backend.
+        basis_gates: Basis gates, used without a backend.
+        optimization_level: Transpiler optimization level.
+        seed_transpiler: Seed of the stochastic transpiler passes.
+        cache_dir: Directory of the QPY cache files, None to cache in memory only.
+
+    Returns:
+        transpiled: The transpiled template, its angles are expressions of the
+                    ParameterVector of Ansatz.get_template().
+    """
+
+    from qiskit import qpy, transpile
+
+    target = target_key(
+        backend, coupling_map, basis_gates, optimization_level, seed_transpiler
+    )
+    key = (ansatz.circuit_id, ansatz.repitition, ansatz.feature_dim, target)
+    if key in _TRANSPILED_CACHE:
+        return _TRANSPILED_CACHE[key]
+
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, "ansatz_%d_%d_%d_%s.qpy" % key)
+    if path is not None and os.path.exists(path):
+        with open(path, "rb") as file:
+            transpiled = qpy.load(file)[0]
+    else:
+        template, _ = ansatz.get_template()
+        transpiled = transpile(
+            template,
+            backend=backend,
+            coupling_map=coupling_map,
+            basis_gates=basis_gates,
+            optimization_level=optimization_level,
+            seed_transpiler=seed_transpiler,
+        )
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # other workers sharing cache_dir may qpy.load the path meanwhile, they
+            # must only ever see a complete QPY file
+            partial = "%s.%d" % (path, os.getpid())
+            with open(partial, "wb") as file:
+                qpy.dump(transpiled, file)
+            os.replace(partial, path)
+    _TRANSPILED_CACHE[key] = transpiled
+    return transpiled
+
+
+def bind_transpiled(transpiled: Any, values: np.ndarray) -> List[Any]:
+    """
+    Args:
+        transpiled: Transpiled template from transpile_template.
+        values: Array of shape (samples, num_parameters) as for
+                Ansatz.bind_parameters.
+
+    Returns:
+        circuits: One bound copy of the transpiled template per row of values, ready
+                  to run on the target without further transpilation.
+
+    Raises:
+        ValueError: If values does not have a column per entry of the ParameterVector
+                    of the template.
+    """
+
+    values = np.atleast_2d(values)
+    parameters = transpiled.parameters
+    num_parameters = len(parameters[0].vector) if len(parameters) else 0
+    if values.shape[1] != num_parameters:
+        raise ValueError(
+            f"Expected {num_parameters} parameters per sample, got {values.shape[1]}"
+        )
+    # parameters the transpiler kept, in the sorted order assign_parameters expects
+    used = [param.index for param in transpiled.parameters]
+    return [transpiled.assign_parameters(row[used]) for row in values]
+
+
+def transpiled_ansatzes(
+    circuit_id: int,
+    feature_dim: int,
+    repitition: int,
+    samples: int = 1,
+    values: Optional[np.ndarray] = None,
+    **target: Any,
+) -> List[Any]:
+    """
+    Args:
+        circuit_id: The id of the circuit in the order mentioned in
+                    https://doi.org/10.1007/s42484-021-00038-w
+        feature_dim: The no. of qubits of the circuit.
+        repitition: The no of repitition of the layers of the circuit.
+        samples: Number of random instances drawn when values is not given.
+        values: Array of shape (samples, num_parameters), drawn with np.random.randn
+                like get_ansatz does when not given.
+        target: backend or coupling_map and basis_gates, optimization_level,
+                seed_transpiler and cache_dir of transpile_template.
+
+    Returns:
+        circuits: Random instances of the ansatz transpiled for the target.
+    """
+
+    ansatz = Ansatz(repitition, feature_dim, circuit_id)
+    if values is None:
+        values = np.random.randn(samples, ansatz.num_parameters())
+    return bind_transpiled(transpile_template(ansatz, **target), values)
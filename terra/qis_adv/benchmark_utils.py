@@ -0,0 +1,83 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Timing and result history helpers shared by the benchmark scripts"""
+
+import json
+import os
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int = 3,
+    cleanup: Optional[Callable[[], Any]] = None,
+) -> Tuple[float, int]:
+    """
+    Args:
+        func: The benchmarked function, called without arguments.
+        repeat: Number of timed runs.
+        cleanup: Called after every run, untimed, e.g. to close the figures func
+                 draws.
+
+    Returns:
+        seconds: Best wall time over repeat runs.
+        peak_bytes: Peak traced memory of one more run.
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+        if cleanup is not None:
+            cleanup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if cleanup is not None:
+        cleanup()
+    return best, peak
+
+
+def append_history(path: str, results: List[Dict[str, Any]], **versions: Any) -> None:
+    """
+    Appends one run to the JSON history at path, creating it if it does not exist.
+
+    Args:
+        path: Path of the JSON history file.
+        results: Rows of the run.
+        versions: Further entries of the run, e.g. versions of the benchmarked
+                  packages, next to the time, Python and NumPy versions.
+    """
+
+    history = []
+    if os.path.exists(path):
+        with open(path) as file:
+            history = json.load(file)
+    history.append(
+        {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            **versions,
+            "results": results,
+        }
+    )
+    with open(path, "w") as file:
+        json.dump(history, file, indent=1)
@@ -12,7 +12,7 @@
 
 """Parametric Circuit Module"""
 
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 
 
@@ -40,8 +40,13 @@ class Ansatz:
         self.feature_dim = feature_dim
         self.circuit_id = circuit_id
 
-    def get_circ_1(self) -> Any:
+    def get_circ_1(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(1). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 1 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -51,8 +56,8 @@ class Ansatz:
         # by qiskit.circuit
         from qiskit import QuantumCircuit
 
-        num_par = 2 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_par)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(1))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -63,8 +68,13 @@ class Ansatz:
             circ.barrier()
         return circ
 
-    def get_circ_2(self) -> Any:
+    def get_circ_2(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(2). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 2 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -74,8 +84,8 @@ class Ansatz:
         # by qiskit.circuit
         from qiskit import QuantumCircuit
 
-        num_par = 2 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_par)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(2))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
 
@@ -89,8 +99,13 @@ class Ansatz:
             circ.barrier()
         return circ
 
-    def get_circ_3(self) -> Any:
+    def get_circ_3(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(3). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 3 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -100,10 +115,8 @@ class Ansatz:
         # by qiskit.circuit
         from qiskit import QuantumCircuit
 
-        num_par = (2 * self.feature_dim * self.repitition) + (
-            self.feature_dim - 1
-        ) * self.repitition
-        paravec = np.random.randn(num_par)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(3))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
 
@@ -118,8 +131,13 @@ class Ansatz:
             circ.barrier()
         return circ
 
-    def get_circ_4(self) -> Any:
+    def get_circ_4(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(4). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 4 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -129,10 +147,8 @@ class Ansatz:
         # by qiskit.circuit
         from qiskit import QuantumCircuit
 
-        num_par = (2 * self.feature_dim * self.repitition) + (
-            self.feature_dim - 1
-        ) * self.repitition
-        paravec = np.random.randn(num_par)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(4))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
 
@@ -147,27 +163,70 @@ class Ansatz:
             circ.barrier()
         return circ
 
-    def get_circ_5(self) -> Any:
+    def get_circ_5(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(5). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             ansatz: Circuit 5 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
 
+        if paravec is not None:
+            return self._get_all_to_all_circ(paravec, "crz")
+
+        # bind the cached template, _get_nlocal_circ is the original construction
+        ansatz = Ansatz(self.repitition, self.feature_dim, 5)
+        return ansatz.bind_parameters(np.random.randn(self.num_parameters(5)))[0]
+
+    def get_circ_6(self, paravec: Optional[Any] = None) -> Any:
+        """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(6). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
+        Returns:
+            ansatz: Circuit 6 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
+        """
+
+        if paravec is not None:
+            return self._get_all_to_all_circ(paravec, "crx")
+
+        # bind the cached template, _get_nlocal_circ is the original construction
+        ansatz = Ansatz(self.repitition, self.feature_dim, 6)
+        return ansatz.bind_parameters(np.random.randn(self.num_parameters(6)))[0]
+
+    def _get_nlocal_circ(self, paravec: Any, gate: str) -> Any:
+        """
+        Args:
+            paravec: Parameters of circuit 5 or 6, the first two are the shared RX and
+                     RZ angles and the rest the angles of the controlled rotations.
+            gate: "crz" for circuit 5 and "crx" for circuit 6.
+
+        Returns:
+            ansatz: Circuit 5 or 6 built from feature_dim full width entangling blocks
+                    handed to NLocal. Much slower than binding the template, it is kept
+                    as the reference construction for benchmarks.
+        """
+
         # Runtime imports to avoid circular imports causeed by QuantumInstance
         # getting initialized by imported utils/__init__ which is imported
         # by qiskit.circuit
         from qiskit.circuit.library import NLocal
         from qiskit import QuantumCircuit
 
-        paravec = np.random.randn(2)
-        paravec_2 = np.random.randn(self.feature_dim * (self.feature_dim - 1) // 2)
+        paravec, paravec_2 = paravec[:2], paravec[2:]
         blocks = []
         for block in reversed(range(self.feature_dim)):
             block_circ = QuantumCircuit(self.feature_dim)
+            controlled_rotation = getattr(block_circ, gate)
             p_pointer = 0
             for i in reversed(range(self.feature_dim)):
                 if i != block:
-                    block_circ.crz(paravec_2[p_pointer], block, i)
+                    controlled_rotation(paravec_2[p_pointer], block, i)
                     p_pointer += 1
             blocks.append(block_circ)
         rot_layer = QuantumCircuit(1)
@@ -181,42 +240,50 @@ class Ansatz:
         )
         return ansatz
 
-    def get_circ_6(self) -> Any:
+    def _get_all_to_all_circ(self, paravec: Any, gate: str) -> Any:
         """
+        Args:
+            paravec: Parameters of circuit 5 or 6, the first two are the shared RX and
+                     RZ angles and the rest the angles of the controlled rotations.
+            gate: "crz" for circuit 5 and "crx" for circuit 6.
+
         Returns:
-            ansatz: Circuit 6 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
+            circ: The circuit NLocal builds for circuits 5 and 6, written out gate by
+                  gate so that parameters are shared between repititions the same way
+                  as with the numeric blocks handed to NLocal.
         """
 
         # Runtime imports to avoid circular imports causeed by QuantumInstance
         # getting initialized by imported utils/__init__ which is imported
         # by qiskit.circuit
-        from qiskit.circuit.library import NLocal
         from qiskit import QuantumCircuit
 
-        paravec = np.random.randn(2)
-        paravec_2 = np.random.randn(self.feature_dim * (self.feature_dim - 1) // 2)
-        blocks = []
-        for block in reversed(range(self.feature_dim)):
-            block_circ = QuantumCircuit(self.feature_dim)
-            p_pointer = 0
-            for i in reversed(range(self.feature_dim)):
-                if i != block:
-                    block_circ.crx(paravec_2[p_pointer], block, i)
-                    p_pointer += 1
-            blocks.append(block_circ)
-        rot_layer = QuantumCircuit(1)
-        rot_layer.rx(paravec[0], 0)
-        rot_layer.rz(paravec[1], 0)
-        ansatz = NLocal(
-            self.feature_dim,
-            rotation_blocks=rot_layer,
-            entanglement_blocks=blocks,
-            reps=self.repitition,
-        )
-        return ansatz
+        circ = QuantumCircuit(self.feature_dim)
+        controlled_rotation = getattr(circ, gate)
+
+        def rotation_layer():
+            for i in range(self.feature_dim):
+                circ.rx(paravec[0], i)
+                circ.rz(paravec[1], i)
 
-    def get_circ_7(self) -> Any:
+        rotation_layer()
+        for _ in range(self.repitition):
+            for block in reversed(range(self.feature_dim)):
+                p_pointer = 0
+                for i in reversed(range(self.feature_dim)):
+                    if i != block:
+                        controlled_rotation(paravec[2 + p_pointer], block, i)
+                        p_pointer += 1
+            rotation_layer()
+        return circ
+
+    def get_circ_7(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(7). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 7 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -227,8 +294,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_par = (4 * self.feature_dim + self.feature_dim) * self.repitition
-        paravec = np.random.randn(num_par)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(7))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -254,8 +321,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_8(self) -> Any:
+    def get_circ_8(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(8). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 8 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -266,8 +338,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_par = (4 * self.feature_dim + self.feature_dim) * self.repitition
-        paravec = np.random.randn(num_par)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(8))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -293,8 +365,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_9(self) -> Any:
+    def get_circ_9(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(9). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 9 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -305,8 +382,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = self.feature_dim * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(9))
         arg_count = 0
         circ = QuantumCircuit(self.feature_dim)
         for _ in range(self.repitition):
@@ -320,8 +397,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_10(self) -> Any:
+    def get_circ_10(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(10). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 10 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -332,8 +414,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = self.feature_dim * self.repitition + self.feature_dim
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(10))
         arg_count = 0
         circ = QuantumCircuit(self.feature_dim)
         for i in range(self.feature_dim):
@@ -351,8 +433,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_11(self) -> Any:
+    def get_circ_11(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(11). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 11 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -363,12 +450,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = (
-            (2 * self.feature_dim + int(self.feature_dim / 2 - 1) * 4) * self.repitition
-            if self.feature_dim % 2 == 0
-            else (4 * self.feature_dim - 2) * self.repitition
-        )
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(11))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -394,8 +477,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_12(self) -> Any:
+    def get_circ_12(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(12). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 12 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -406,12 +494,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = (
-            (2 * self.feature_dim + int(self.feature_dim / 2 - 1) * 4) * self.repitition
-            if self.feature_dim % 2 == 0
-            else (4 * self.feature_dim - 2) * self.repitition
-        )
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(12))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -438,8 +522,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_13(self) -> Any:
+    def get_circ_13(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(13). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 13 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -449,8 +538,8 @@ class Ansatz:
         # by qiskit.circuit
         from qiskit import QuantumCircuit
 
-        num_pars = 4 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(13))
         circ = QuantumCircuit(self.feature_dim)
 
         arg_count = 0
@@ -482,8 +571,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_14(self) -> Any:
+    def get_circ_14(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(14). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 14 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -494,8 +588,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = 4 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(14))
         circ = QuantumCircuit(self.feature_dim)
 
         arg_count = 0
@@ -527,8 +621,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_15(self) -> Any:
+    def get_circ_15(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(15). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 15 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -539,8 +638,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = 2 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(15))
         circ = QuantumCircuit(self.feature_dim)
 
         arg_count = 0
@@ -570,8 +669,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_16(self) -> Any:
+    def get_circ_16(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(16). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 16 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -582,8 +686,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = (3 * self.feature_dim - 1) * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(16))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -606,8 +710,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_17(self) -> Any:
+    def get_circ_17(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(17). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 17 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -618,8 +727,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = (3 * self.feature_dim - 1) * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(17))
         circ = QuantumCircuit(self.feature_dim)
         arg_count = 0
         for _ in range(self.repitition):
@@ -642,8 +751,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_18(self) -> Any:
+    def get_circ_18(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(18). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
             circ: Circuit 18 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -654,8 +768,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = 3 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(18))
         circ = QuantumCircuit(self.feature_dim)
 
         arg_count = 0
@@ -677,8 +791,13 @@ class Ansatz:
 
         return circ
 
-    def get_circ_19(self) -> Any:
+    def get_circ_19(self, paravec: Optional[Any] = None) -> Any:
         """
+        Args:
+            paravec: Parameters of the circuit, of length num_parameters(19). Random
+                     parameters are drawn when not given, a ParameterVector gives a
+                     parameterized template.
+
         Returns:
                 circ: Circuit 9 mentioned in  https://doi.org/10.1007/s42484-021-00038-w
         """
@@ -689,8 +808,8 @@ class Ansatz:
 
         from qiskit import QuantumCircuit
 
-        num_pars = 3 * self.feature_dim * self.repitition
-        paravec = np.random.randn(num_pars)
+        if paravec is None:
+            paravec = np.random.randn(self.num_parameters(19))
         circ = QuantumCircuit(self.feature_dim)
 
         arg_count = 0
@@ -712,6 +831,99 @@ class Ansatz:
 
         return circ
 
+    def num_parameters(self, circuit_id: Optional[int] = None) -> int:
+        """
+        Args:
+            circuit_id: The id of the circuit, defaults to the circuit_id of the class.
+
+        Returns:
+            num_pars: Length of the parameter vector used by get_circ_<circuit_id>.
+
+        Raises:
+            ValueError: If circuit_id is not one of the available circuits.
+        """
+
+        circuit_id = self.circuit_id if circuit_id is None else circuit_id
+        n, reps = self.feature_dim, self.repitition
+        if circuit_id in (1, 2, 15):
+            return 2 * n * reps
+        if circuit_id in (3, 4):
+            return (2 * n * reps) + (n - 1) * reps
+        if circuit_id in (5, 6):
+            # shared RX, RZ angles and the angles of the controlled rotations
+            return 2 + n * (n - 1) // 2
+        if circuit_id in (7, 8):
+            return (4 * n + n) * reps
+        if circuit_id == 9:
+            return n * reps
+        if circuit_id == 10:
+            return n * reps + n
+        if circuit_id in (11, 12):
+            return (
+                (2 * n + int(n / 2 - 1) * 4) * reps
+                if n % 2 == 0
+                else (4 * n - 2) * reps
+            )
+        if circuit_id in (13, 14):
+            return 4 * n * reps
+        if circuit_id in (16, 17):
+            return (3 * n - 1) * reps
+        if circuit_id in (18, 19):
+            return 3 * n * reps
+        raise ValueError(
+            f"Unknown circuit_id {circuit_id}, available circuit ids are "
+            f"{sorted(ANSATZ_REGISTRY)}"
+        )
+
+    def get_template(self) -> Tuple[Any, Any]:
+        """
+        Returns:
+            template: The circuit of circuit_id built once with a ParameterVector in
+                      place of random parameters. It is cached per
+                      (circuit_id, repitition, feature_dim), copy it before modifying.
+            paravec: The ParameterVector of length num_parameters() used by template.
+        """
+
+        # Runtime imports to avoid circular imports causeed by QuantumInstance
+        # getting initialized by imported utils/__init__ which is imported
+        # by qiskit.circuit
+        from qiskit.circuit import ParameterVector
+
+        key = (self.circuit_id, self.repitition, self.feature_dim)
+        if key not in _TEMPLATE_CACHE:
+            if self.circuit_id not in ANSATZ_REGISTRY:
+                raise ValueError(
+                    f"Unknown circuit_id {self.circuit_id}, available circuit ids are "
+                    f"{sorted(ANSATZ_REGISTRY)}"
+                )
+            paravec = ParameterVector("θ", self.num_parameters())
+            builder, _ = ANSATZ_REGISTRY[self.circuit_id]
+            _TEMPLATE_CACHE[key] = (getattr(self, builder)(paravec), paravec)
+        return _TEMPLATE_CACHE[key]
+
+    def bind_parameters(self, values: np.ndarray) -> List[Any]:
+        """
+        Args:
+            values: Array of shape (samples, num_parameters()) with one parameter
+                    vector per row, e.g. np.random.randn(samples, num_parameters()).
+
+        Returns:
+            circuits: One bound copy of the cached template per row of values.
+
+        Raises:
+            ValueError: If values does not have num_parameters() columns.
+        """
+
+        template, paravec = self.get_template()
+        values = np.atleast_2d(values)
+        if values.shape[1] != len(paravec):
+            raise ValueError(
+                f"Expected {len(paravec)} parameters per sample, got {values.shape[1]}"
+            )
+        # some circuits do not use every entry of their parameter vector
+        used = [param.index for param in template.parameters]
+        return [template.assign_parameters(row[used]) for row in values]
+
     def get_ansatz(self) -> Any:
         """
         Returns:
@@ -720,28 +932,74 @@ class Ansatz:
                         identity in the class variables e.g. circuit_id = 1 will return
                         the 1st circuit mentioned in
                         https://doi.org/10.1007/s42484-021-00038-w
+        Raises:
+                ValueError: If circuit_id is not one of the available circuits.
+        """
+
+        if self.circuit_id not in ANSATZ_REGISTRY:
+            raise ValueError(
+                f"Unknown circuit_id {self.circuit_id}, available circuit ids are "
+                f"{sorted(ANSATZ_REGISTRY)}"
+            )
+
+        # only the requested circuit is built
+        builder, _ = ANSATZ_REGISTRY[self.circuit_id]
+        return getattr(self, builder)()
+
+    @staticmethod
+    def available_ansatzes() -> Dict[int, str]:
+        """
+        Returns:
+                ansatzes: Mapping of every available circuit_id to a short description
+                        of the layer structure of that circuit.
         """
 
-        ansatzes = {
-            1: self.get_circ_1(),
-            2: self.get_circ_2(),
-            3: self.get_circ_3(),
-            4: self.get_circ_4(),
-            5: self.get_circ_5(),
-            6: self.get_circ_6(),
-            7: self.get_circ_7(),
-            8: self.get_circ_8(),
-            9: self.get_circ_9(),
-            10: self.get_circ_10(),
-            11: self.get_circ_11(),
-            12: self.get_circ_12(),
-            13: self.get_circ_13(),
-            14: self.get_circ_14(),
-            15: self.get_circ_15(),
-            16: self.get_circ_16(),
-            17: self.get_circ_17(),
-            18: self.get_circ_18(),
-            19: self.get_circ_19(),
-        }
-
-        return ansatzes[self.circuit_id]
+        return {circuit_id: desc for circuit_id, (_, desc) in ANSATZ_REGISTRY.items()}
+
+    @staticmethod
+    def describe(circuit_id: int) -> str:
+        """
+        Args:
+            circuit_id: The id of the circuit in the order mentioned in
+                        https://doi.org/10.1007/s42484-021-00038-w
+
+        Returns:
+                description: Short description of the layer structure of the circuit.
+
+        Raises:
+                ValueError: If circuit_id is not one of the available circuits.
+        """
+
+        if circuit_id not in ANSATZ_REGISTRY:
+            raise ValueError(
+                f"Unknown circuit_id {circuit_id}, available circuit ids are "
+                f"{sorted(ANSATZ_REGISTRY)}"
+            )
+        return ANSATZ_REGISTRY[circuit_id][1]
+
+
+# (circuit_id, repitition, feature_dim) -> (template circuit, ParameterVector)
+_TEMPLATE_CACHE: Dict[Tuple[int, int, int], Tuple[Any, Any]] = {}
+
+# circuit_id -> (name of the Ansatz builder method, layer structure of one repitition)
+ANSATZ_REGISTRY = {
+    1: ("get_circ_1", "RX-RZ on every qubit, no entanglement"),
+    2: ("get_circ_2", "RX-RZ on every qubit, linear CNOT ladder"),
+    3: ("get_circ_3", "RX-RZ on every qubit, linear CRZ ladder"),
+    4: ("get_circ_4", "RX-RZ on every qubit, linear CRX ladder"),
+    5: ("get_circ_5", "RX-RZ on every qubit, all-to-all CRZ blocks"),
+    6: ("get_circ_6", "RX-RZ on every qubit, all-to-all CRX blocks"),
+    7: ("get_circ_7", "RX-RZ, CRZ on even pairs, RX-RZ, CRZ on odd pairs"),
+    8: ("get_circ_8", "RX-RZ, CRX on even pairs, RX-RZ, CRX on odd pairs"),
+    9: ("get_circ_9", "H on every qubit, linear CZ ladder, RX on every qubit"),
+    10: ("get_circ_10", "initial RY layer, then H, linear CZ chain, RX on every qubit"),
+    11: ("get_circ_11", "RX-RZ, CNOT even pairs, RY-RZ inner qubits, CNOT odd pairs"),
+    12: ("get_circ_12", "RX-RZ, CZ even pairs, RY-RZ inner qubits, CZ odd pairs"),
+    13: ("get_circ_13", "RY, circular CRZ, RY, reversed circular CRZ"),
+    14: ("get_circ_14", "RY, circular CRX, RY, reversed circular CRX"),
+    15: ("get_circ_15", "RY, circular CNOT, RY, reversed circular CNOT"),
+    16: ("get_circ_16", "RX-RZ on every qubit, CRZ on even pairs, CRZ on odd pairs"),
+    17: ("get_circ_17", "RX-RZ on every qubit, CRX on even pairs, CRX on odd pairs"),
+    18: ("get_circ_18", "RX-RZ on every qubit, circular CRZ"),
+    19: ("get_circ_19", "RX-RZ on every qubit, circular CRX"),
+}
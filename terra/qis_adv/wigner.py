@@ -9,15 +9,235 @@
 
 """Plotting Wigner functions."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 import numpy as np
-from qiskit.tools.visualization._matplotlib import HAS_MATPLOTLIB
 
-if HAS_MATPLOTLIB:
+try:
+    from matplotlib import animation
     from matplotlib import cm
     from matplotlib import pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import PatchCollection, PolyCollection
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 pylint: disable=unused-import
+    HAS_MATPLOTLIB = True
+except ImportError:
+    HAS_MATPLOTLIB = False
+
+# upper bound on the number of complex entries held by one chunk of the
+# phase point contraction in wigner_function
+_MAX_CHUNK_ENTRIES = 2**22
+
+
+def _wigner_dtypes(dtype):
+    """Real and complex dtypes of matching precision for dtype."""
+    real = np.zeros(0, dtype=dtype).real.dtype
+    if real not in (np.float32, np.float64):
+        raise ValueError('Wigner function dtype must be single or double '
+                         'precision, got %s' % np.dtype(dtype))
+    return real, np.result_type(real, np.complex64)
+
+
+@lru_cache(maxsize=8)
+def _wigner_kernel(res, dtype=np.complex128):
+    """Single qubit phase point kernels on the equal angle res x res grid.
+
+    Args:
+        res (int): number of theta and phi values in meshgrid
+        dtype (np.dtype): complex dtype of the kernels, they are always
+            evaluated in double precision and rounded afterwards.
 
+    Returns:
+        np.ndarray: read-only array of shape (res, res, 2, 2) where entry
+        [phi, theta] is the 2 x 2 kernel at that point of phase space.
+    """
+    phi_vals = np.linspace(0, np.pi, num=res)
+    theta_vals = np.linspace(0, 0.5*np.pi, num=res)
+    harr = np.sqrt(3)
+    costheta = harr*np.cos(2*theta_vals)
+    sintheta = harr*np.sin(2*theta_vals)
+    phase = np.exp(2j*phi_vals)
+
+    kernel = np.empty((res, res, 2, 2), dtype=np.complex128)
+    kernel[:, :, 0, 0] = 0.5*(1+costheta)
+    kernel[:, :, 0, 1] = -0.5*np.outer(phase, sintheta)
+    kernel[:, :, 1, 0] = -0.5*np.outer(phase.conj(), sintheta)
+    kernel[:, :, 1, 1] = 0.5*(1-costheta)
+    kernel = kernel.astype(dtype, copy=False)
+    kernel.setflags(write=False)
+    return kernel
+
+
+def wigner_function(state, res=100, dtype=np.float64):
+    """Compute the equal angle slice spin Wigner function of an arbitrary
+    quantum state.
+
+    The phase point kernel of every grid point is the n-fold tensor power
+    of a 2 x 2 kernel, so the trace is contracted one qubit at a time for
+    whole blocks of grid points rather than building 2**n x 2**n kernels.
+
+    Args:
+        state (np.matrix[[complex]]):
+            - Matrix of 2**n x 2**n complex numbers
+            - State Vector of 2**n x 1 complex numbers
+        res (int) : number of theta and phi values in meshgrid
+            on sphere (creates a res x res grid of points)
+        dtype (np.dtype): precision of the computation, np.float32 (or
+            np.complex64) halves the memory traffic and is plenty for
+            plotting, see ``wigner_precision_report``.
+    Returns:
+        np.ndarray: res x res array of Wigner function values indexed
+        by [phi, theta].
+    Raises:
+        ValueError: if dtype is not single or double precision.
+    """
+    real, cplx = _wigner_dtypes(dtype)
+    state = np.asarray(state, dtype=cplx)
+    if state.ndim == 1:
+        state = np.outer(state,
+                         state)  # turns state vector to a density matrix
+    num = int(np.log2(state.shape[0]))  # number of qubits
+    dim = 2**(num-1)
+    # kernel[p, b, a] pairs with state[a, :, b, :], so flatten both over (a, b)
+    kernel = _wigner_kernel(res, cplx).reshape(res*res, 2, 2)
+    kernel = kernel.transpose(0, 2, 1).reshape(res*res, 4)
+    state = state.reshape(2, dim, 2, dim).transpose(0, 2, 1, 3).reshape(4, -1)
+
+    w = np.empty(res*res, dtype=real)
+    chunk = max(1, _MAX_CHUNK_ENTRIES // (dim*dim))
+    for start in range(0, res*res, chunk):
+        delta = kernel[start:start+chunk]
+        # trace out the qubits one at a time against the kernel
+        part = delta.dot(state)
+        half = dim
+        while half > 1:
+            half //= 2
+            part = part.reshape(-1, 2, half, 2, half).transpose(0, 1, 3, 2, 4)
+            part = np.matmul(delta[:, None, :],
+                             part.reshape(-1, 4, half*half))[:, 0]
+        w[start:start+chunk] = np.real(part[:, 0])
+    return w.reshape(res, res)
+
+
+def wigner_precision_report(state, res=100, dtype=np.float32):
+    """Compare a reduced precision Wigner function against the double
+    precision reference.
+
+    Args:
+        state (np.matrix[[complex]]): state accepted by
+            ``wigner_function``.
+        res (int) : number of theta and phi values in meshgrid
+        dtype (np.dtype): precision to check.
+    Returns:
+        dict: ``max_abs_error`` and ``rms_error`` of the reduced precision
+        values, ``max_rel_error`` relative to the largest reference
+        magnitude and ``w_max`` of the reference.
+    """
+    reference = wigner_function(state, res=res, dtype=np.float64)
+    reduced = wigner_function(state, res=res, dtype=dtype)
+    error = np.abs(reduced.astype(np.float64) - reference)
+    w_max = float(np.amax(np.abs(reference)))
+    return {'max_abs_error': float(np.amax(error)),
+            'max_rel_error': float(np.amax(error)) / w_max if w_max else 0.0,
+            'rms_error': float(np.sqrt(np.mean(error**2))),
+            'w_max': w_max}
+
+
+def _surface_colors(colors, rows, cols, rcount, ccount):
+    """Pick one color per polygon the way ``plot_surface`` samples
+    ``facecolors``, flattened in the order the polygons are created."""
+    rstride = int(max(np.ceil(rows / rcount), 1))
+    cstride = int(max(np.ceil(cols / ccount), 1))
+    return colors[np.ix_(np.arange(0, rows-1, rstride),
+                         np.arange(0, cols-1, cstride))].reshape(-1, 4)
+
+
+class _WignerSphere:
+    """Sphere mesh, reflection surfaces and colorbar of a Wigner function
+    plot, drawn once and recolored for every new set of Wigner values.
+
+    The surfaces are first drawn white so that the shading applied by
+    ``plot_surface`` can be kept and multiplied into later face colors.
+    """
 
-def plot_wigner_function(state, res=100, figsize=None):
+    def __init__(self, fig, res):
+        self.res = res
+        ax = fig.add_subplot(111, projection='3d')
+
+        u = np.linspace(0, 2 * np.pi, res)
+        v = np.linspace(0, np.pi, res)
+        x = np.outer(np.cos(u), np.sin(v))
+        y = np.outer(np.sin(u), np.sin(v))
+        z = np.outer(np.ones(np.size(u)), np.cos(v))  # creates a sphere mesh
+
+        half, quarter = int(res/2), int(res/4)
+        # (x, y, z, rows of w, columns of w, rcount) of the sphere and
+        # the bottom, side and back reflections
+        layout = [
+            (x, y, z, slice(0, res), slice(0, res), res),
+            (x[0:res, half:res], y[0:res, half:res],
+             -1.5*np.ones((res, res-half)),
+             slice(0, res), slice(half, res), res/2),
+            (-1.5*np.ones((int(3*res/4)-quarter, res)),
+             y[quarter:int(3*res/4), 0:res], z[quarter:int(3*res/4), 0:res],
+             slice(quarter, int(3*res/4)), slice(0, res), res/2),
+            (x[half:res, 0:res], 1.5*np.ones((res-half, res)),
+             z[half:res, 0:res],
+             slice(half, res), slice(0, res), res/2),
+        ]
+        self._surfaces = []
+        for sx, sy, sz, rows, cols, count in layout:
+            surf = ax.plot_surface(sx, sy, sz,
+                                   facecolors=np.ones(sx.shape + (4,)),
+                                   rcount=count, ccount=count,
+                                   linewidth=0, zorder=0.5,
+                                   antialiased=False)
+            # unsorted face colors, i.e. the shading of a white surface
+            shade = np.array(PolyCollection.get_facecolor(surf))
+            self._surfaces.append((surf, rows, cols, count, shade))
+
+        ax.xaxis.set_pane_color((0.8, 0.8, 0.8, 1.0))
+        ax.yaxis.set_pane_color((0.8, 0.8, 0.8, 1.0))
+        ax.zaxis.set_pane_color((0.8, 0.8, 0.8, 1.0))
+        ax.set_xticks([], [])
+        ax.set_yticks([], [])
+        ax.set_zticks([], [])
+        ax.grid(False)
+        ax.xaxis.pane.set_edgecolor('k')
+        ax.yaxis.pane.set_edgecolor('k')
+        ax.zaxis.pane.set_edgecolor('k')
+        ax.set_xlim(-1.5, 1.5)
+        ax.set_ylim(-1.5, 1.5)
+        ax.set_zlim(-1.5, 1.5)
+        self._mappable = cm.ScalarMappable(cmap=cm.RdBu)
+        self._mappable.set_array([-1, 1])
+        cbar = fig.colorbar(self._mappable, ax=ax, shrink=0.5, aspect=10,
+                            ticks=[-1, -0.5, 0, 0.5, 1.0])
+        cbar.ax.tick_params(labelsize=14)
+
+    def update(self, w):
+        """Recolor the sphere and its reflections with new Wigner values.
+
+        Args:
+            w (np.ndarray): res x res Wigner function values indexed
+                by [phi, theta].
+        """
+        w_max = np.amax(w)
+        w_c = cm.RdBu((w+w_max)/(2*w_max))  # color data for sphere
+        for surf, rows, cols, count, shade in self._surfaces:
+            region = w_c[rows, cols]
+            colors = _surface_colors(region, region.shape[0],
+                                     region.shape[1], count, count)
+            colors[:, :3] *= shade[:, :3]
+            surf.set_facecolor(colors)
+        self._mappable.set_clim(-w_max, w_max)
+
+
+def plot_wigner_function(state, res=100, figsize=None, dtype=np.float64):
     """Plot the equal angle slice spin Wigner function of an arbitrary
     quantum state.
 
@@ -28,6 +248,8 @@ def plot_wigner_function(state, res=100, figsize=None):
         res (int) : number of theta and phi values in meshgrid
             on sphere (creates a res x res grid of points)
         figsize (tuple): Figure size in inches.
+        dtype (np.dtype): precision of the Wigner function computation,
+            see ``wigner_function``.
     Returns:
          matplotlib.Figure: The matplotlib.Figure of the visualization
     Raises:
@@ -44,108 +266,316 @@ def plot_wigner_function(state, res=100, figsize=None):
     if figsize is None:
         figsize = (11, 9)
 
-    state = np.asarray(state)
-    if state.ndim == 1:
-        state = np.outer(state,
-                         state)  # turns state vector to a density matrix
-    num = int(np.log2(state.shape[0]))  # number of qubits
-    phi_vals = np.linspace(0, np.pi, num=res,
-                           dtype=np.complex_)
-    theta_vals = np.linspace(0, 0.5*np.pi, num=res,
-                             dtype=np.complex_)  # phi and theta values for WF
-    w = np.empty([res, res])
-    harr = np.sqrt(3)
-    delta_su2 = np.zeros((2, 2), dtype=np.complex_)
-
-    # create the spin Wigner function
-    for theta in range(res):
-        costheta = harr*np.cos(2*theta_vals[theta])
-        sintheta = harr*np.sin(2*theta_vals[theta])
-
-        for phi in range(res):
-            delta_su2[0, 0] = 0.5*(1+costheta)
-            delta_su2[0, 1] = -0.5*(np.exp(2j*phi_vals[phi])*sintheta)
-            delta_su2[1, 0] = -0.5*(np.exp(-2j*phi_vals[phi])*sintheta)
-            delta_su2[1, 1] = 0.5*(1-costheta)
-            kernel = 1
-            for _ in range(num):
-                kernel = np.kron(kernel,
-                                 delta_su2)  # creates phase point kernel
-
-            w[phi, theta] = np.real(np.trace(state.dot(kernel)))  # Wigner function
-
-    # Plot a sphere (x,y,z) with Wigner function facecolor data stored in Wc
+    w = wigner_function(state, res=res, dtype=dtype)
+
+    # Plot a sphere (x,y,z) with Wigner function facecolor data
     fig = plt.figure(figsize=figsize)
-    ax = fig.gca(projection='3d')
-    w_max = np.amax(w)
-    # Color data for plotting
-    w_c = cm.RdBu((w+w_max)/(2*w_max))  # color data for sphere
-    w_c2 = cm.RdBu((w[0:res, int(res/2):res]+w_max)/(2*w_max))  # bottom
-    w_c3 = cm.RdBu((w[int(res/4):int(3*res/4), 0:res]+w_max) /
-                   (2*w_max))  # side
-    w_c4 = cm.RdBu((w[int(res/2):res, 0:res]+w_max)/(2*w_max))  # back
-
-    u = np.linspace(0, 2 * np.pi, res)
-    v = np.linspace(0, np.pi, res)
-    x = np.outer(np.cos(u), np.sin(v))
-    y = np.outer(np.sin(u), np.sin(v))
-    z = np.outer(np.ones(np.size(u)), np.cos(v))  # creates a sphere mesh
-
-    ax.plot_surface(x, y, z, facecolors=w_c,
-                    vmin=-w_max, vmax=w_max,
-                    rcount=res, ccount=res,
-                    linewidth=0, zorder=0.5,
-                    antialiased=False)  # plots Wigner Bloch sphere
-
-    ax.plot_surface(x[0:res, int(res/2):res],
-                    y[0:res, int(res/2):res],
-                    -1.5*np.ones((res, int(res/2))),
-                    facecolors=w_c2,
-                    vmin=-w_max, vmax=w_max,
-                    rcount=res/2, ccount=res/2,
-                    linewidth=0, zorder=0.5,
-                    antialiased=False)  # plots bottom reflection
-
-    ax.plot_surface(-1.5*np.ones((int(res/2), res)),
-                    y[int(res/4):int(3*res/4), 0:res],
-                    z[int(res/4):int(3*res/4), 0:res],
-                    facecolors=w_c3,
-                    vmin=-w_max, vmax=w_max,
-                    rcount=res/2, ccount=res/2,
-                    linewidth=0, zorder=0.5,
-                    antialiased=False)  # plots side reflection
-
-    ax.plot_surface(x[int(res/2):res, 0:res],
-                    1.5*np.ones((int(res/2), res)),
-                    z[int(res/2):res, 0:res],
-                    facecolors=w_c4,
-                    vmin=-w_max, vmax=w_max,
-                    rcount=res/2, ccount=res/2,
-                    linewidth=0, zorder=0.5,
-                    antialiased=False)  # plots back reflection
-
-    ax.w_xaxis.set_pane_color((0.8, 0.8, 0.8, 1.0))
-    ax.w_yaxis.set_pane_color((0.8, 0.8, 0.8, 1.0))
-    ax.w_zaxis.set_pane_color((0.8, 0.8, 0.8, 1.0))
-    ax.set_xticks([], [])
-    ax.set_yticks([], [])
-    ax.set_zticks([], [])
-    ax.grid(False)
-    ax.xaxis.pane.set_edgecolor('k')
-    ax.yaxis.pane.set_edgecolor('k')
-    ax.zaxis.pane.set_edgecolor('k')
-    ax.set_xlim(-1.5, 1.5)
-    ax.set_ylim(-1.5, 1.5)
-    ax.set_zlim(-1.5, 1.5)
-    m = cm.ScalarMappable(cmap=cm.RdBu)
-    m.set_array([-w_max, w_max])
-    cbar = plt.colorbar(m, shrink=0.5, aspect=10,
-                        ticks=[-1, -0.5, 0, 0.5, 1.0])
-    cbar.ax.tick_params(labelsize=14)
+    _WignerSphere(fig, res).update(w)
     plt.close(fig)
     return fig
 
 
+def animate_wigner_function(states, res=100, figsize=None, filename=None,
+                            fps=10, writer=None, dpi=None, dtype=np.float64):
+    """Animate the equal angle slice spin Wigner function of a sequence of
+    states, e.g. the trajectory of a parametric circuit or a Hamiltonian
+    evolution.
+
+    The sphere mesh and its reflections are drawn once; each frame only
+    computes the Wigner function of its state and recolors the surfaces.
+
+    Args:
+        states (list): states accepted by ``plot_wigner_function``, one
+            per frame.
+        res (int) : number of theta and phi values in meshgrid
+            on sphere (creates a res x res grid of points)
+        figsize (tuple): Figure size in inches.
+        filename (str): if given, the frames are streamed to this video or
+            GIF file as they are rendered.
+        fps (int): frames per second.
+        writer (str or matplotlib.animation.MovieWriter): writer used when
+            saving, defaults to 'pillow' for GIF files and matplotlib's
+            ``animation.writer`` otherwise.
+        dpi (float): resolution of the saved frames.
+        dtype (np.dtype): precision of the Wigner function computation,
+            see ``wigner_function``.
+    Returns:
+        matplotlib.animation.FuncAnimation: the animation, e.g. for
+        ``to_jshtml()`` in a notebook.
+    Raises:
+        ImportError: Requires matplotlib.
+    """
+    if not HAS_MATPLOTLIB:
+        raise ImportError('Must have Matplotlib installed.')
+    if figsize is None:
+        figsize = (11, 9)
+
+    states = list(states)
+    fig = plt.figure(figsize=figsize)
+    sphere = _WignerSphere(fig, res)
+
+    def _update(state):
+        sphere.update(wigner_function(state, res=res, dtype=dtype))
+        return []
+
+    anim = animation.FuncAnimation(fig, _update, frames=states,
+                                   init_func=lambda: [],
+                                   interval=1000/fps, repeat=False)
+    plt.close(fig)
+    if filename:
+        if writer is None and filename.lower().endswith('.gif'):
+            writer = 'pillow'
+        anim.save(filename, writer=writer, fps=fps, dpi=dpi)
+    return anim
+
+
+def _render_wigner_functions(states, filenames, res, figsize, dpi, dtype):
+    """Render a chunk of states on a single reused Agg figure."""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    sphere = _WignerSphere(fig, res)
+    for state, filename in zip(states, filenames):
+        sphere.update(wigner_function(state, res=res, dtype=dtype))
+        fig.savefig(filename, dpi=dpi)
+    return len(filenames)
+
+
+def _render_wigner_plaquettes(wigner_datas, filenames, max_wigner, dpi):
+    """Render a chunk of plaquettes on Agg figures without pyplot."""
+    for wigner_data, filename in zip(wigner_datas, filenames):
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        _draw_wigner_plaquette(fig, wigner_data, max_wigner)
+        fig.savefig(filename, dpi=dpi)
+    return len(filenames)
+
+
+def _render_in_pool(render, items, filenames, processes, *args):
+    """Split items over a process pool and render each share to files."""
+    if len(items) != len(filenames):
+        raise ValueError('Expected one filename per item, got %d items and '
+                         '%d filenames' % (len(items), len(filenames)))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(items)))
+    if processes == 1:
+        return render(items, filenames, *args)
+
+    bounds = np.linspace(0, len(items), processes+1).astype(int)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(render, items[lo:hi], filenames[lo:hi],
+                                   *args)
+                   for lo, hi in zip(bounds[:-1], bounds[1:])]
+        return sum(future.result() for future in futures)
+
+
+def save_wigner_functions(states, filenames, res=100, figsize=None,
+                          dpi=None, processes=None, dtype=np.float64):
+    """Render the spin Wigner function of many states straight to files.
+
+    Each worker process draws the sphere and its reflections once on an
+    Agg canvas (no pyplot state involved) and only recolors the surfaces
+    for every further state it is given.
+
+    Args:
+        states (list): states accepted by ``plot_wigner_function``.
+        filenames (list[str]): output file for each state, the format is
+            taken from the extension.
+        res (int) : number of theta and phi values in meshgrid
+            on sphere (creates a res x res grid of points)
+        figsize (tuple): Figure size in inches.
+        dpi (float): resolution of the saved images, defaults to
+            matplotlib's ``savefig.dpi``.
+        processes (int): number of worker processes, defaults to the
+            number of CPUs. Use 1 to render in the calling process.
+        dtype (np.dtype): precision of the Wigner function computation,
+            see ``wigner_function``.
+    Returns:
+        int: number of files written.
+    Raises:
+        ImportError: Requires matplotlib.
+        ValueError: if the number of states and filenames differ.
+    """
+    if not HAS_MATPLOTLIB:
+        raise ImportError('Must have Matplotlib installed.')
+    if figsize is None:
+        figsize = (11, 9)
+    return _render_in_pool(_render_wigner_functions, list(states),
+                           list(filenames), processes, res, figsize, dpi,
+                           dtype)
+
+
+def save_wigner_plaquettes(wigner_datas, filenames, max_wigner='local',
+                           dpi=None, processes=None):
+    """Render many Wigner function plaquettes straight to files.
+
+    Args:
+        wigner_datas (list): plaquette data accepted by
+            ``plot_wigner_plaquette``.
+        filenames (list[str]): output file for each plaquette.
+        max_wigner (str or float): see ``plot_wigner_plaquette``.
+        dpi (float): resolution of the saved images.
+        processes (int): number of worker processes, defaults to the
+            number of CPUs. Use 1 to render in the calling process.
+    Returns:
+        int: number of files written.
+    Raises:
+        ImportError: Requires matplotlib.
+        ValueError: if the number of plaquettes and filenames differ.
+    """
+    if not HAS_MATPLOTLIB:
+        raise ImportError('Must have Matplotlib installed.')
+    return _render_in_pool(_render_wigner_plaquettes, list(wigner_datas),
+                           list(filenames), processes, max_wigner, dpi)
+
+
+def build_wigner_circuits(circuit, phis, thetas, qubits, backend=None,
+                          optimization_level=1):
+    """Build the rotated measurement circuits for points in phase space.
+
+    The measurement is a u(theta, 0, phi) rotation followed by a
+    measurement on every qubit in qubits. A single parameterized circuit
+    is built, transpiled for backend if one is given, and then bound once
+    per point.
+
+    Args:
+        circuit (QuantumCircuit): circuit preparing the state, without
+            measurements.
+        phis (np.array): phi values of shape (len(qubits), points).
+        thetas (np.array): theta values of shape (len(qubits), points).
+        qubits (list[int]): qubits of circuit to measure, qubit
+            qubits[k] is measured into clbit k.
+        backend (Backend): backend whose basis gates and coupling map the
+            circuits are transpiled for, None to keep the u rotations.
+        optimization_level (int): transpiler optimization level.
+    Returns:
+        list[QuantumCircuit]: one measurement circuit per point.
+    Raises:
+        ValueError: if phis or thetas do not match qubits.
+    """
+    # Runtime imports so the plotting functions do not depend on the
+    # qiskit version
+    from qiskit import QuantumCircuit, transpile
+    from qiskit.circuit import ParameterVector
+
+    phis = np.atleast_2d(np.asarray(phis, dtype=float))
+    thetas = np.atleast_2d(np.asarray(thetas, dtype=float))
+    if phis.shape != thetas.shape or phis.shape[0] != len(qubits):
+        raise ValueError('phis and thetas must both have shape '
+                         '(len(qubits), points), got %s and %s'
+                         % (phis.shape, thetas.shape))
+
+    theta_par = ParameterVector('theta', len(qubits))
+    phi_par = ParameterVector('phi', len(qubits))
+    template = QuantumCircuit(circuit.num_qubits, len(qubits))
+    template.compose(circuit, qubits=range(circuit.num_qubits), inplace=True)
+    for index, qubit in enumerate(qubits):
+        template.u(theta_par[index], 0, phi_par[index], qubit)
+    template.measure(list(qubits), range(len(qubits)))
+    if backend is not None:
+        template = transpile(template, backend,
+                             optimization_level=optimization_level)
+
+    parameters = list(theta_par) + list(phi_par)
+    values = np.vstack((thetas, phis)).T
+    circuits = []
+    for point, value in enumerate(values):
+        bound = template.assign_parameters(dict(zip(parameters, value)))
+        bound.name = '%s_wigner_phase_point%d' % (circuit.name, point)
+        circuits.append(bound)
+    return circuits
+
+
+def wigner_data_from_counts(counts, num_qubits, shots=None):
+    """Estimate Wigner function values from rotated measurement counts.
+
+    The parity kernel of a measured bit string is the product of
+    1/2 + sqrt(3)/2 for each 0 and 1/2 - sqrt(3)/2 for each 1, so it only
+    depends on the number of ones. All counts are binned by that weight
+    in a single pass.
+
+    Args:
+        counts (list[dict]): counts of the circuits from
+            ``build_wigner_circuits``, one dict per point.
+        num_qubits (int): number of measured qubits.
+        shots (int): shots per circuit, defaults to the total of each
+            counts dict.
+    Returns:
+        np.array: Wigner function value of each point.
+    Raises:
+        ValueError: if there are no counts or a point has no counts.
+    """
+    counts = list(counts)
+    if not counts:
+        raise ValueError('No counts given')
+    missing = [point for point, entry in enumerate(counts)
+               if not entry or sum(entry.values()) == 0]
+    if missing:
+        raise ValueError('No counts for the points %s' % missing)
+    p = np.array([0.5 + 0.5 * np.sqrt(3), 0.5 - 0.5 * np.sqrt(3)])
+    ones = np.arange(num_qubits + 1)
+    parity = p[0]**(num_qubits - ones) * p[1]**ones
+
+    point_index, weight, hits = [], [], []
+    for point, entry in enumerate(counts):
+        point_index.append(np.full(len(entry), point))
+        weight.append(np.fromiter((key.count('1') for key in entry),
+                                  dtype=int, count=len(entry)))
+        hits.append(np.fromiter(entry.values(), dtype=float,
+                                count=len(entry)))
+    point_index = np.concatenate(point_index)
+    hits = np.concatenate(hits)
+    w = np.bincount(point_index, weights=hits * parity[np.concatenate(weight)],
+                    minlength=len(counts))
+    if shots is None:
+        shots = np.bincount(point_index, weights=hits, minlength=len(counts))
+    return w / shots
+
+
+def measure_wigner_data(circuit, phis, thetas, qubits, backend, shots=1024,
+                        batch_size=None, optimization_level=1):
+    """Measure Wigner function values at points in phase space without
+    state tomography.
+
+    Args:
+        circuit (QuantumCircuit): circuit preparing the state, without
+            measurements.
+        phis (np.array): phi values of shape (len(qubits), points).
+        thetas (np.array): theta values of shape (len(qubits), points).
+        qubits (list[int]): qubits of circuit to measure.
+        backend (Backend): backend to run the circuits on, the circuits
+            are transpiled for it first.
+        shots (int): shots per point.
+        batch_size (int): maximum circuits per job, defaults to a single
+            job holding every point. All jobs are submitted before any
+            result is awaited.
+        optimization_level (int): transpiler optimization level.
+    Returns:
+        np.array: Wigner function value of each point, ready for
+        ``plot_wigner_data``.
+    Raises:
+        ValueError: if the backend returns no counts for a point.
+    """
+    from qiskit.exceptions import QiskitError
+
+    circuits = build_wigner_circuits(circuit, phis, thetas, qubits, backend,
+                                     optimization_level)
+    if batch_size is None:
+        batch_size = len(circuits)
+    jobs = [backend.run(circuits[start:start+batch_size], shots=shots)
+            for start in range(0, len(circuits), batch_size)]
+    counts = []
+    for start, job in zip(range(0, len(circuits), batch_size), jobs):
+        result = job.result()
+        for index in range(len(circuits[start:start+batch_size])):
+            try:
+                counts.append(result.get_counts(index))
+            except QiskitError:
+                # reported with the other empty points below
+                counts.append({})
+    return wigner_data_from_counts(counts, len(qubits), shots=shots)
+
+
 def plot_wigner_curve(wigner_data, xaxis=None, filename=None):
     """Plots a curve for points in phase space of the spin Wigner function.
 
@@ -189,7 +619,17 @@ def plot_wigner_plaquette(wigner_data, max_wigner='local', filename=None):
     """
     if not HAS_MATPLOTLIB:
         raise ImportError('Must have Matplotlib installed.')
-    wigner_data = np.matrix(wigner_data)
+    fig = plt.figure()
+    _draw_wigner_plaquette(fig, wigner_data, max_wigner)
+    if filename:
+        plt.savefig(filename)
+    else:
+        plt.show()
+
+
+def _draw_wigner_plaquette(fig, wigner_data, max_wigner):
+    """Draw the plaquette circles as a single collection on fig."""
+    wigner_data = np.atleast_2d(np.asarray(wigner_data, dtype=float))
     dim = wigner_data.shape
 
     if max_wigner == 'local':
@@ -200,20 +640,21 @@ def plot_wigner_plaquette(wigner_data, max_wigner='local', filename=None):
         w_max = max_wigner  # For a float input
     w_max = float(w_max)
 
-    cmap = plt.cm.get_cmap('seismic_r')
+    cmap = cm.seismic_r
 
     xax = dim[1]-0.5
     yax = dim[0]-0.5
     norm = np.amax(dim)
 
-    fig = plt.figure(figsize=((xax+0.5)*6/norm, (yax+0.5)*6/norm))
-    ax = fig.gca()
+    fig.set_size_inches((xax+0.5)*6/norm, (yax+0.5)*6/norm)
+    ax = fig.add_subplot(111)
 
-    for x in range(int(dim[1])):
-        for y in range(int(dim[0])):
-            circle = plt.Circle(
-                (x, y), 0.49, color=cmap((wigner_data[y, x]+w_max)/(2*w_max)))
-            ax.add_artist(circle)
+    # circles are laid out column by column, matching wigner_data.T
+    circles = [Circle((x, y), 0.49)
+               for x in range(int(dim[1])) for y in range(int(dim[0]))]
+    colors = cmap((wigner_data.T.ravel()+w_max)/(2*w_max))
+    ax.add_collection(PatchCollection(circles, facecolors=colors,
+                                      edgecolors=colors))
 
     ax.set_xlim(-1, xax+0.5)
     ax.set_ylim(-1, yax+0.5)
@@ -221,11 +662,7 @@ def plot_wigner_plaquette(wigner_data, max_wigner='local', filename=None):
     ax.set_yticks([], [])
     m = cm.ScalarMappable(cmap=cm.seismic_r)
     m.set_array([-w_max, w_max])
-    plt.colorbar(m, shrink=0.5, aspect=10)
-    if filename:
-        plt.savefig(filename)
-    else:
-        plt.show()
+    fig.colorbar(m, ax=ax, shrink=0.5, aspect=10)
 
 
 def plot_wigner_data(wigner_data, phis=None, method=None, filename=None):
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018, IBM.
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+# pylint: disable=invalid-name,wrong-import-position
+
+"""Benchmarks for the compute and plotting paths of wigner.py.
+
+Run from this folder, e.g.::
+
+    python wigner_benchmarks.py --qubits 1 2 3 4 5 --res 25 50 100
+    python wigner_benchmarks.py --output results.json
+
+Every case reports the wall time (best of ``--repeat`` runs) and the peak
+memory allocated while it runs. The Wigner functions of a fixed set of
+seeded states are checked against a reference dataset computed with the
+original point by point kernel loop, stored in ``--reference`` so later
+runs only pay for the loop once.
+"""
+
+import argparse
+import io
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np  # noqa: E402
+from matplotlib import pyplot as plt  # noqa: E402
+
+import wigner  # noqa: E402
+from benchmark_utils import append_history, measure  # noqa: E402
+
+REFERENCE_QUBITS = (1, 2, 3, 4)
+REFERENCE_RES = (25, 50)
+
+
+def random_state(num_qubits, kind, seed=None):
+    """Seeded test state.
+
+    Args:
+        num_qubits (int): number of qubits.
+        kind (str): 'pure' for a real state vector, 'mixed' for a full
+            rank density matrix.
+        seed (int): seed of the random generator.
+    Returns:
+        np.array: the state vector or density matrix.
+    """
+    rng = np.random.RandomState(seed)
+    dim = 2**num_qubits
+    if kind == 'pure':
+        vec = rng.randn(dim)
+        return vec / np.linalg.norm(vec)
+    mat = rng.randn(dim, dim) + 1j*rng.randn(dim, dim)
+    rho = mat.dot(mat.conj().T)
+    return rho / np.trace(rho)
+
+
+def loop_wigner_function(state, res):
+    """The original point by point evaluation of the spin Wigner function,
+    building the full 2**n x 2**n kernel at every grid point."""
+    state = np.asarray(state)
+    if state.ndim == 1:
+        state = np.outer(state, state)
+    num = int(np.log2(state.shape[0]))
+    phi_vals = np.linspace(0, np.pi, num=res, dtype=np.complex128)
+    theta_vals = np.linspace(0, 0.5*np.pi, num=res, dtype=np.complex128)
+    w = np.empty([res, res])
+    harr = np.sqrt(3)
+    delta_su2 = np.zeros((2, 2), dtype=np.complex128)
+    for theta in range(res):
+        costheta = harr*np.cos(2*theta_vals[theta])
+        sintheta = harr*np.sin(2*theta_vals[theta])
+        for phi in range(res):
+            delta_su2[0, 0] = 0.5*(1+costheta)
+            delta_su2[0, 1] = -0.5*(np.exp(2j*phi_vals[phi])*sintheta)
+            delta_su2[1, 0] = -0.5*(np.exp(-2j*phi_vals[phi])*sintheta)
+            delta_su2[1, 1] = 0.5*(1-costheta)
+            kernel = 1
+            for _ in range(num):
+                kernel = np.kron(kernel, delta_su2)
+            w[phi, theta] = np.real(np.trace(state.dot(kernel)))
+    return w
+
+
+def _reference_key(num_qubits, kind, res):
+    return '%s_n%d_res%d' % (kind, num_qubits, res)
+
+
+def check_reference(path):
+    """Compare wigner_function with the reference dataset at path,
+    creating the dataset first if it does not exist.
+
+    Returns:
+        float: largest absolute deviation from the reference.
+    """
+    if os.path.exists(path):
+        with np.load(path) as data:
+            reference = dict(data)
+    else:
+        reference = {}
+        for num in REFERENCE_QUBITS:
+            for kind in ('pure', 'mixed'):
+                state = random_state(num, kind, seed=num)
+                for res in REFERENCE_RES:
+                    reference[_reference_key(num, kind, res)] = \
+                        loop_wigner_function(state, res)
+        np.savez_compressed(path, **reference)
+
+    error = 0.0
+    for num in REFERENCE_QUBITS:
+        for kind in ('pure', 'mixed'):
+            state = random_state(num, kind, seed=num)
+            for res in REFERENCE_RES:
+                w = wigner.wigner_function(state, res=res)
+                error = max(error, np.amax(np.abs(
+                    w - reference[_reference_key(num, kind, res)])))
+    return float(error)
+
+
+def _close_figures():
+    plt.close('all')
+
+
+def bench_wigner_function(qubits, resolutions, repeat, plot=True):
+    """wigner_function alone and plot_wigner_function including the
+    sphere drawing, for pure and mixed states."""
+    results = []
+    for num in qubits:
+        for kind in ('pure', 'mixed'):
+            state = random_state(num, kind, seed=num)
+            for res in resolutions:
+                cases = [('wigner_function',
+                          lambda: wigner.wigner_function(state, res=res))]
+                if plot:
+                    cases.append((
+                        'plot_wigner_function',
+                        lambda: wigner.plot_wigner_function(
+                            state, res=res).savefig(io.BytesIO())))
+                for name, func in cases:
+                    seconds, peak = measure(func, repeat, _close_figures)
+                    results.append({'benchmark': name, 'qubits': num,
+                                    'state': kind, 'res': res,
+                                    'seconds': seconds, 'peak_bytes': peak})
+    return results
+
+
+def bench_plaquette(sizes, repeat):
+    """plot_wigner_plaquette on growing square grids."""
+    results = []
+    for size in sizes:
+        data = np.random.RandomState(size).uniform(-1, 1, (size, size))
+        seconds, peak = measure(lambda: wigner.plot_wigner_plaquette(
+            data, filename=io.BytesIO()), repeat, _close_figures)
+        results.append({'benchmark': 'plot_wigner_plaquette', 'size': size,
+                        'seconds': seconds, 'peak_bytes': peak})
+    return results
+
+
+def bench_plot_wigner_data(repeat):
+    """plot_wigner_data dispatch for each kind of input it recognises."""
+    rng = np.random.RandomState(0)
+    inputs = {'point': rng.uniform(-1, 1, 1),
+              'curve': rng.uniform(-1, 1, 64),
+              'plaquette': rng.uniform(-1, 1, (8, 8))}
+    results = []
+    for method, data in inputs.items():
+        seconds, peak = measure(lambda: wigner.plot_wigner_data(
+            data, method=method, filename=io.BytesIO()), repeat,
+            _close_figures)
+        results.append({'benchmark': 'plot_wigner_data', 'method': method,
+                        'seconds': seconds, 'peak_bytes': peak})
+    return results
+
+
+def _print_results(results):
+    for row in results:
+        case = ', '.join('%s=%s' % (key, value) for key, value in row.items()
+                         if key not in ('benchmark', 'seconds', 'peak_bytes'))
+        print('%-22s %-36s %10.4f s %10.2f MiB'
+              % (row['benchmark'], case, row['seconds'],
+                 row['peak_bytes'] / 2**20))
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--qubits', type=int, nargs='+',
+                        default=list(range(1, 11)))
+    parser.add_argument('--res', type=int, nargs='+',
+                        default=[25, 50, 100, 200, 400])
+    parser.add_argument('--plaquettes', type=int, nargs='+',
+                        default=[4, 8, 16, 32, 64])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-plot', action='store_true',
+                        help='only time wigner_function, skip drawing')
+    parser.add_argument('--reference', default='wigner_reference.npz')
+    parser.add_argument('--output', help='append the results to this JSON '
+                        'file to keep a history of runs')
+    args = parser.parse_args(argv)
+
+    error = check_reference(args.reference)
+    print('max deviation from reference: %.3e' % error)
+
+    results = bench_wigner_function(args.qubits, args.res, args.repeat,
+                                    plot=not args.no_plot)
+    results += bench_plaquette(args.plaquettes, args.repeat)
+    results += bench_plot_wigner_data(args.repeat)
+    _print_results(results)
+
+    if args.output:
+        append_history(args.output, results,
+                       matplotlib=matplotlib.__version__,
+                       reference_error=error)
+
+
+if __name__ == '__main__':
+    main()